@@ -3,52 +3,361 @@ Audio extraction utilities for MP4 Transcriber.
 """
 
 import os
+import json
 import subprocess
 import tempfile
 
+import numpy as np
 
-def extract_audio(video_path, audio_path=None, verbose=False):
+
+# Sample rate Whisper expects for raw audio input
+SAMPLE_RATE = 16000
+
+# Size of each read from the ffmpeg pipe
+PIPE_CHUNK_SIZE = 1 << 20
+
+# Audio codecs that can be stream-copied into a container Whisper can read
+COPY_CONTAINERS = {
+    'aac': '.m4a',
+    'alac': '.m4a',
+    'mp3': '.mp3',
+}
+
+
+def probe_audio(path):
+    """
+    Read the format of the first audio stream using ffprobe.
+
+    Args:
+        path (str): Path to the media file
+
+    Returns:
+        tuple: (sample rate, channels, codec name), or None if the file has
+            no audio stream or probing failed
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'a:0',
+        '-show_entries', 'stream=sample_rate,channels,codec_name',
+        '-of', 'json',
+        path
+    ]
+
+    try:
+        output = subprocess.run(cmd, check=True, capture_output=True).stdout
+        streams = json.loads(output).get('streams', [])
+        if not streams:
+            return None
+        stream = streams[0]
+        return (
+            int(stream.get('sample_rate', 0)),
+            int(stream.get('channels', 0)),
+            stream.get('codec_name')
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        return None
+
+
+def probe_media(path):
+    """
+    Read the duration and size of a media file.
+    
+    Args:
+        path (str): Path to the media file
+        
+    Returns:
+        tuple: (path, duration in seconds or None, size in bytes or None)
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'csv=p=0',
+        path
+    ]
+    
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = None
+    
+    try:
+        output = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+        duration = float(output.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        duration = None
+    
+    return path, duration, size
+
+
+def _ffmpeg_input_args(video_path, start=None, duration=None, threads=None):
+    """
+    Build the leading ffmpeg arguments for reading (part of) an input file.
+
+    ``-ss`` is placed before ``-i`` so ffmpeg seeks in the container rather
+    than decoding and discarding everything before the offset.
+
+    Args:
+        video_path (str): Path to the input file
+        start (float, optional): Offset in seconds to start reading from
+        duration (float, optional): Length in seconds to read
+        threads (int, optional): Decoder threads for the input, 0 for all cores
+
+    Returns:
+        list: ffmpeg arguments up to and including the input options
+    """
+    cmd = ['ffmpeg']
+    if threads is not None:
+        cmd.extend(['-threads', str(threads)])
+    if start is not None:
+        cmd.extend(['-ss', str(start)])
+    cmd.extend(['-i', video_path])
+    if duration is not None:
+        cmd.extend(['-t', str(duration)])
+    return cmd
+
+
+def _progress_total(video_path, start=None, duration=None, total_duration=None):
+    """
+    Work out how many seconds of audio an extraction will produce.
+
+    Args:
+        video_path (str): Path to the input file
+        start (float, optional): Offset in seconds extraction starts from
+        duration (float, optional): Length in seconds requested
+        total_duration (float, optional): Known duration of the whole file,
+            saves an ffprobe call when given
+
+    Returns:
+        float: Seconds of audio expected, or None if unknown
+    """
+    if duration is not None:
+        return duration
+    if total_duration is None:
+        total_duration = probe_media(video_path)[1]
+    if total_duration is None:
+        return None
+    return max(total_duration - (start or 0), 0) or None
+
+
+def _is_cancelled(cancel_event):
+    """Check whether an optional cancel event has been set."""
+    return cancel_event is not None and cancel_event.is_set()
+
+
+def extract_audio(video_path, audio_path=None, verbose=False, force_wav=False,
+                  start=None, duration=None, progress_callback=None,
+                  total_duration=None, threads=0, cancel_event=None):
     """
     Extract audio from video file using ffmpeg.
     
+    The audio stream is copied as-is when its codec can be stored in a
+    container Whisper reads (AAC, MP3), which avoids a full decode and
+    re-encode. Other codecs are decoded to WAV. An audio file that is
+    already in such a container is returned unchanged when no output path
+    is given, so callers must not delete the result if it equals
+    ``video_path``.
+
     Args:
         video_path (str): Path to the video file
-        audio_path (str, optional): Path to save the extracted audio
+        audio_path (str, optional): Path to save the extracted audio. A
+            ``.wav`` path always produces decoded PCM.
         verbose (bool): Whether to show detailed output
+        force_wav (bool): Always decode to WAV instead of copying the stream
+        start (float, optional): Offset in seconds to start extracting from.
+            The seek happens before the input is opened, so ffmpeg jumps
+            through the container index instead of decoding up to the
+            offset. With stream copy the start snaps to the nearest
+            keyframe, so it is only accurate to within a frame or so.
+        duration (float, optional): Length in seconds of audio to extract
+        progress_callback (callable, optional): Called with the percentage
+            of the audio written so far, parsed from ffmpeg's ``-progress``
+            output
+        total_duration (float, optional): Duration of the input in seconds,
+            if already known, used to turn ffmpeg's position into a
+            percentage
+        threads (int): Threads ffmpeg may use for decoding and encoding,
+            0 to use all cores
+        cancel_event (threading.Event, optional): Checked on every progress
+            line; once set, ffmpeg is killed and None is returned
         
     Returns:
-        str: Path to the extracted audio file, or None if extraction failed
+        str: Path to the extracted audio file (possibly ``video_path``
+            itself), or None if extraction failed or was cancelled
     """
+    if audio_path is not None and audio_path.lower().endswith('.wav'):
+        force_wav = True
+
+    copy_suffix = None
+    if not force_wav:
+        audio_format = probe_audio(video_path)
+        if audio_format:
+            copy_suffix = COPY_CONTAINERS.get(audio_format[2])
+        # Whisper can read the whole file as it is, copying would only
+        # duplicate it
+        if (
+            audio_path is None
+            and copy_suffix is not None
+            and start is None
+            and duration is None
+            and os.path.splitext(video_path)[1].lower() == copy_suffix
+        ):
+            return video_path
+        # Only copy when the requested container can hold the codec
+        if audio_path is not None and copy_suffix is not None:
+            if os.path.splitext(audio_path)[1].lower() != copy_suffix:
+                copy_suffix = None
+
     if audio_path is None:
         # Create a temporary file if no output path is specified
-        audio_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
+        audio_file = tempfile.NamedTemporaryFile(suffix=copy_suffix or '.wav', delete=False)
         audio_path = audio_file.name
         audio_file.close()
     
     # Command to extract audio
-    cmd = [
-        'ffmpeg', 
-        '-i', video_path,
-        '-y',  # Always overwrite existing files
-        '-q:a', '0',
-        '-map', 'a',
-        '-vn', audio_path
-    ]
+    if copy_suffix:
+        cmd = _ffmpeg_input_args(video_path, start, duration) + [
+            '-y',  # Always overwrite existing files
+            '-vn',
+            '-acodec', 'copy',
+            audio_path
+        ]
+    else:
+        cmd = _ffmpeg_input_args(video_path, start, duration) + [
+            '-y',  # Always overwrite existing files
+            '-threads', str(threads),  # 0 uses all cores for the re-encode
+            '-q:a', '0',
+            '-map', 'a',
+            '-vn', audio_path
+        ]
     
     if not verbose:
         cmd.extend(['-loglevel', 'error'])
     
+    # Machine-readable progress on stdout instead of the stats line
+    cmd.extend(['-progress', 'pipe:1', '-nostats'])
+    
+    total_us = None
+    if progress_callback is not None:
+        total = _progress_total(video_path, start, duration, total_duration)
+        if total:
+            total_us = total * 1_000_000
+    
     try:
-        subprocess.run(cmd, check=True)
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE)
+        for line in process.stdout:
+            if _is_cancelled(cancel_event):
+                process.kill()
+                process.wait()
+                print("Audio extraction cancelled")
+                if os.path.exists(audio_path):
+                    os.unlink(audio_path)
+                return None
+            # Despite its name, out_time_ms is in microseconds
+            if total_us and line.startswith(b'out_time_ms='):
+                try:
+                    position = int(line.split(b'=', 1)[1])
+                except ValueError:
+                    continue  # N/A before the first frame is written
+                progress_callback(min(position / total_us * 100, 100.0))
+        returncode = process.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
         print(f"Audio extracted successfully to {audio_path}")
         return audio_path
-    except subprocess.CalledProcessError as e:
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Error extracting audio: {e}")
         if os.path.exists(audio_path):
             os.unlink(audio_path)
         return None
 
 
+def extract_audio_to_array(video_path, start=None, duration=None,
+                           progress_callback=None, total_duration=None, threads=0,
+                           cancel_event=None):
+    """
+    Decode the audio of a media file straight into memory using ffmpeg.
+
+    ffmpeg writes 16 kHz mono PCM to stdout, which is read in chunks and
+    converted to the float32 array Whisper consumes, so no temporary audio
+    file is written to disk.
+
+    Args:
+        video_path (str): Path to the video file
+        start (float, optional): Offset in seconds to start decoding from
+        duration (float, optional): Length in seconds of audio to decode
+        progress_callback (callable, optional): Called with the percentage
+            of the audio decoded so far
+        total_duration (float, optional): Duration of the input in seconds,
+            if already known
+        threads (int): Threads ffmpeg may use for decoding, 0 to use all cores
+        cancel_event (threading.Event, optional): Checked after every chunk
+            read; once set, ffmpeg is killed and None is returned
+
+    Returns:
+        numpy.ndarray: float32 samples in [-1, 1], or None if decoding
+            failed or was cancelled
+    """
+    cmd = _ffmpeg_input_args(video_path, start, duration, threads) + [
+        '-vn',
+        '-f', 's16le',
+        '-acodec', 'pcm_s16le',
+        '-ac', '1',
+        '-ar', str(SAMPLE_RATE),
+        '-loglevel', 'error',
+        '-'
+    ]
+
+    total_samples = None
+    if progress_callback is not None:
+        total = _progress_total(video_path, start, duration, total_duration)
+        if total:
+            total_samples = total * SAMPLE_RATE
+
+    # stderr goes to a file rather than a pipe: nothing reads it while
+    # stdout is drained, and a full stderr pipe would stall ffmpeg
+    with tempfile.TemporaryFile() as stderr:
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+        except FileNotFoundError as e:
+            print(f"Error extracting audio: {e}")
+            return None
+
+        # Drain stdout in chunks so ffmpeg never blocks on a full pipe
+        chunks = []
+        samples = 0
+        while True:
+            chunk = process.stdout.read(PIPE_CHUNK_SIZE)
+            if not chunk:
+                break
+            if _is_cancelled(cancel_event):
+                process.kill()
+                process.stdout.close()
+                process.wait()
+                print("Audio extraction cancelled")
+                return None
+            chunks.append(np.frombuffer(chunk, np.int16))
+            if total_samples:
+                # The pipe carries exactly SAMPLE_RATE samples per second
+                samples += len(chunks[-1])
+                progress_callback(min(samples / total_samples * 100, 100.0))
+
+        process.stdout.close()
+        if process.wait() != 0:
+            stderr.seek(0)
+            print(f"Error extracting audio: {stderr.read().decode(errors='replace').strip()}")
+            return None
+
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+
+    # Scale in place to avoid a second full-size float32 copy
+    samples = np.concatenate(chunks).astype(np.float32)
+    samples *= 1 / 32768.0
+    return samples
+
+
 def check_ffmpeg_installed():
     """
     Check if ffmpeg is installed and available in PATH.
@@ -0,0 +1,117 @@
+"""
+On-disk cache of transcription results for MP4 Transcriber.
+"""
+
+import os
+import json
+import mmap
+import hashlib
+from importlib import metadata
+from pathlib import Path
+
+from mp4_transcriber.cpu import has_cpu_flag
+
+
+# Root directory for everything MP4 Transcriber caches
+CACHE_DIR = Path.home() / '.cache' / 'mp4_transcriber'
+
+# Directory holding cached transcription results
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / 'transcripts'
+
+# Number of bytes from the start of a file that go into its cache key
+HASH_BYTES = 1 << 20
+
+# Distribution that provides each transcription backend
+_BACKEND_PACKAGES = {
+    'whisper': 'openai-whisper',
+    'faster-whisper': 'faster-whisper',
+}
+
+
+# SHA-256 is fastest with hardware support, BLAKE2b is faster without it
+_HASH_FACTORY = hashlib.sha256 if has_cpu_flag('sha_ni', 'sha2') else (
+    lambda: hashlib.blake2b(digest_size=32)
+)
+
+
+def _backend_version(backend):
+    """Return the installed version of a backend, or 'unknown'."""
+    try:
+        return metadata.version(_BACKEND_PACKAGES.get(backend, backend))
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def cache_key(file_path, model_size, backend, compute_type=None):
+    """
+    Build the cache key for transcribing a file with the given settings.
+    
+    Only the first HASH_BYTES of the file are hashed, together with its
+    size, so keys stay cheap to compute for large videos. The bytes are
+    hashed straight from a memory map rather than copied into a buffer.
+    The backend version is part of the key so upgrades invalidate old
+    results.
+    
+    Args:
+        file_path (str): Path to the media file
+        model_size (str): Whisper model size
+        backend (str): Transcription backend
+        compute_type (str, optional): Weight precision used by the backend
+        
+    Returns:
+        str: Hex digest identifying the file and settings
+    """
+    digest = _HASH_FACTORY()
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), min(size, HASH_BYTES), access=mmap.ACCESS_READ) as m:
+                digest.update(m)
+    digest.update(str(size).encode())
+    digest.update(f"|{model_size}|{backend}|{_backend_version(backend)}|{compute_type}".encode())
+    return digest.hexdigest()
+
+
+def load_result(key):
+    """
+    Load a cached transcription result.
+    
+    Args:
+        key (str): Key returned by cache_key
+        
+    Returns:
+        dict: The cached result with 'text' and 'segments', or None on a miss
+    """
+    try:
+        with open(TRANSCRIPT_CACHE_DIR / f"{key}.json", 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_result(key, result):
+    """
+    Cache the parts of a transcription result needed to write transcripts.
+    
+    Args:
+        key (str): Key returned by cache_key
+        result (dict): Transcription result from transcribe_audio
+    """
+    data = {
+        'text': result.get('text', ''),
+        'segments': [
+            {'start': s['start'], 'end': s['end'], 'text': s['text']}
+            for s in result.get('segments', [])
+        ],
+    }
+    
+    os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+    path = TRANSCRIPT_CACHE_DIR / f"{key}.json"
+    tmp_path = path.with_suffix('.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        # Publish atomically so a concurrent reader never sees half a file
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not cache transcription result: {e}")
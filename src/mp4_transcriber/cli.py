@@ -8,6 +8,29 @@ import sys
 
 from mp4_transcriber.audio import check_ffmpeg_installed
 from mp4_transcriber.processor import process_video, batch_process
+from mp4_transcriber.transcription import (
+    BACKENDS,
+    COMPUTE_TYPES,
+    DEFAULT_BACKEND,
+    DEFAULT_BATCH_SIZE,
+    PRECISIONS,
+)
+
+
+def _positive_int(value):
+    """Argparse type for counts that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _non_negative_int(value):
+    """Argparse type for counts where 0 means automatic."""
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or a positive integer, got {value}")
+    return number
 
 
 def parse_args():
@@ -25,12 +48,36 @@ def parse_args():
     parser.add_argument('-m', '--model', default='base', 
                         choices=['tiny', 'base', 'small', 'medium', 'large'],
                         help='Whisper model size (default: base)')
+    parser.add_argument('--backend', default=DEFAULT_BACKEND, choices=BACKENDS,
+                        help='Transcription backend (default: faster-whisper if installed, '
+                             f'otherwise whisper; currently {DEFAULT_BACKEND})')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+                        help='Number of 30-second chunks decoded together with '
+                             f'the faster-whisper backend (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--compute-type', choices=COMPUTE_TYPES,
+                        help='Weight precision for the faster-whisper backend '
+                             '(default: int8_float16 on GPU, int8 on CPU)')
+    parser.add_argument('--precision', default='fp32', choices=PRECISIONS,
+                        help='CPU precision for the whisper backend; bf16 is only used '
+                             'on CPUs with native bfloat16 support (default: fp32)')
+    parser.add_argument('--compile', action='store_true',
+                        help='Compile the whisper backend model with torch.compile '
+                             '(experimental, slow first file)')
+    parser.add_argument('-p', '--processors', type=_positive_int, default=1,
+                        help='Split each file into this many chunks and transcribe them '
+                             'concurrently, faster-whisper backend only (default: 1)')
+    parser.add_argument('--threads', type=int, default=0,
+                        help='CPU threads per transcription (default: library default)')
+    parser.add_argument('-w', '--workers', type=_non_negative_int, default=1,
+                        help='Number of files to transcribe at once in batch mode, '
+                             'each worker loads its own model; 0 picks one worker per '
+                             '--threads cores (default: 1)')
     
     # Optional flags
     parser.add_argument('-t', '--timestamps', action='store_true', 
                         help='Include timestamps in the transcript')
     parser.add_argument('-b', '--batch', action='store_true',
-                        help='Process all MP4 files in the input directory')
+                        help='Process all MP4, MP3 and M4A files in the input directory')
     parser.add_argument('-v', '--verbose', action='store_true',
                         help='Enable verbose output')
     parser.add_argument('--keep-audio', action='store_true',
@@ -67,7 +114,15 @@ def main():
                 args.output, 
                 model_size=args.model, 
                 with_timestamps=args.timestamps,
-                verbose=args.verbose
+                verbose=args.verbose,
+                backend=args.backend,
+                batch_size=args.batch_size,
+                processors=args.processors,
+                threads=args.threads,
+                compute_type=args.compute_type,
+                workers=args.workers,
+                precision=args.precision,
+                compile_model=args.compile
             )
         else:
             process_video(
@@ -76,7 +131,14 @@ def main():
                 model_size=args.model, 
                 with_timestamps=args.timestamps,
                 cleanup=not args.keep_audio,
-                verbose=args.verbose
+                verbose=args.verbose,
+                backend=args.backend,
+                batch_size=args.batch_size,
+                processors=args.processors,
+                threads=args.threads,
+                compute_type=args.compute_type,
+                precision=args.precision,
+                compile_model=args.compile
             )
         return 0
     except Exception as e:
@@ -0,0 +1,41 @@
+"""
+CPU feature detection for MP4 Transcriber.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def cpu_flags():
+    """
+    Read the instruction set flags the CPU advertises (Linux only).
+    
+    The result is cached, so /proc/cpuinfo is read at most once.
+    
+    Returns:
+        frozenset: Flag names such as 'sha_ni' or 'avx512_bf16', empty if
+            they could not be read
+    """
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                # 'flags' on x86, 'Features' on ARM
+                name, _, value = line.partition(':')
+                if name.strip() in ('flags', 'Features'):
+                    return frozenset(value.split())
+    except OSError:
+        pass
+    return frozenset()
+
+
+def has_cpu_flag(*names):
+    """
+    Check whether the CPU advertises any of the given flags.
+    
+    Args:
+        *names (str): Flag names to look for
+        
+    Returns:
+        bool: True if at least one of the flags is present
+    """
+    return not cpu_flags().isdisjoint(names)
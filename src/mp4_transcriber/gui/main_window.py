@@ -5,11 +5,22 @@ Main window implementation for the MP4 Transcriber GUI application.
 import os
 import sys
 import time
+import threading
 import datetime
-import multiprocessing
 import subprocess  # Added for opening folder
 import json  # For saving/loading quick paths
-from mp4_transcriber.gui.processor import GUIProcessor
+from collections import deque
+from dataclasses import dataclass
+
+try:
+    import orjson  # Faster JSON, from the optional "speedups" extra
+except ImportError:
+    orjson = None
+
+from concurrent.futures import ThreadPoolExecutor
+from mp4_transcriber.audio import probe_media
+from mp4_transcriber.gui.processor import GUIProcessor, TranscriptionServer
+from mp4_transcriber.transcription import COMPUTE_TYPES, DEFAULT_COMPUTE_TYPE, format_timestamp
 from mp4_transcriber.gui.quick_path_dialog import (
     QuickPathDialog,
 )  # Import the new dialog
@@ -32,11 +43,69 @@ from PyQt6.QtWidgets import (
     QGroupBox,
     QLineEdit,
     QMessageBox,  # Added for error messages
+    QSpinBox,
 )
-from PyQt6.QtCore import Qt, QThreadPool, QDir, pyqtSignal, QObject, QRunnable, pyqtSlot
+from PyQt6.QtCore import (
+    Qt,
+    QThreadPool,
+    QThread,
+    QDir,
+    QDirIterator,
+    QTimer,
+    pyqtSignal,
+    QObject,
+    QRunnable,
+    pyqtSlot,
+)
+from PyQt6.QtGui import QTextCursor
 
 # QStandardPaths no longer needed
 
+# Extensions of the media files that can be queued (all four characters)
+_MEDIA_EXTS = frozenset((".mp4", ".mp3", ".m4a"))
+
+
+def _is_media(path):
+    """Returns True if the path has a media extension, in any case."""
+    # Only the extension is lowercased, not the whole path
+    return path[-4:].lower() in _MEDIA_EXTS
+
+# Seconds during which completions do not reopen the same output folder
+FOLDER_REOPEN_INTERVAL = 5.0
+
+# Oldest log lines are dropped beyond this many
+MAX_LOG_LINES = 10_000
+
+# File dialog options that skip per-entry symlink resolution and icon
+# lookups, which can take seconds on large or network directories
+FAST_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons
+    | QFileDialog.Option.DontResolveSymlinks
+)
+
+
+@dataclass
+class FileEntry:
+    """
+    A queued file, its state and the table cells that display it.
+    """
+
+    # Slots keep entries small in long queues (dataclass(slots=True) needs 3.10)
+    __slots__ = (
+        "path", "name", "row", "status", "progress",
+        "duration", "size", "duration_item", "status_item",
+    )
+
+    path: str
+    name: str
+    row: int  # Row in the files table
+    status: str
+    progress: int
+    duration: object  # float seconds, None until probed
+    size: object  # int bytes, None until probed
+    duration_item: object  # QTableWidgetItem once the row is shown
+    status_item: object
+
 
 class WorkerSignals(QObject):
     """
@@ -44,12 +113,43 @@ class WorkerSignals(QObject):
     """
 
     started = pyqtSignal(str)
-    progress = pyqtSignal(str, int, str)
     completed = pyqtSignal(str)
     error = pyqtSignal(str, str)
     log = pyqtSignal(str)
 
 
+def affinity_cores(job_index, job_count):
+    """
+    Pick the block of CPU cores a concurrent job should be pinned to.
+
+    Cores are taken from the process's allowed set, optionally narrowed by
+    the DEFAULT_AFFINITY_MASK environment variable (e.g. ``0xff``), and
+    split into equal consecutive blocks so each job keeps its caches.
+
+    Args:
+        job_index: Slot of the job, from 0 to job_count - 1
+        job_count: Number of jobs running at the same time
+
+    Returns:
+        set: CPU numbers for the job, or None if affinity is unsupported
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None  # Only Linux lets a thread choose its cores
+
+    allowed = sorted(os.sched_getaffinity(0))
+    mask = os.environ.get("DEFAULT_AFFINITY_MASK")
+    if mask:
+        try:
+            mask = int(mask, 0)
+            allowed = [cpu for cpu in allowed if mask >> cpu & 1] or allowed
+        except ValueError:
+            print(f"Warning: Ignoring invalid DEFAULT_AFFINITY_MASK '{mask}'")
+
+    per_job = max(1, len(allowed) // max(1, job_count))
+    start = (job_index * per_job) % len(allowed)
+    return set(allowed[start:start + per_job])
+
+
 class TranscriptionWorker(QRunnable):
     """
     Worker thread for handling transcription tasks.
@@ -60,35 +160,74 @@ class TranscriptionWorker(QRunnable):
         file_path,
         output_dir,
         model,
+        compute_type,
         include_timestamps,
         auto_clean,
         keep_audio,
         open_folder,  # Added parameter
+        server,
+        duration=None,
+        threads=0,
+        job_index=0,
+        cores=None,
     ):
         super().__init__()
         self.file_path = file_path
         self.output_dir = output_dir
         self.model = model
+        self.compute_type = compute_type
         self.include_timestamps = include_timestamps
         self.auto_clean = auto_clean
         self.keep_audio = keep_audio
         self.open_folder = open_folder  # Store the value
+        self.server = server
+        self.duration = duration  # From the queue probe, spares a re-probe
+        self.threads = threads  # ffmpeg threads, 0 lets ffmpeg decide
+        self.job_index = job_index  # Concurrency slot the job occupies
+        self.cores = cores  # CPUs to pin this job to, None to not pin
         self.signals = WorkerSignals()
-        self.processor = None
+        # Created up front so Stop can cancel the job before it starts
+        self.processor = GUIProcessor(
+            self.signals, self.server, on_progress=self._store_progress
+        )
+        # Latest (path, percent, operation) for the GUI to poll
+        self._latest = None
+        self._latest_lock = threading.Lock()
+
+    def _store_progress(self, file_path, percent, operation):
+        """Keep only the most recent progress update"""
+        with self._latest_lock:
+            self._latest = (file_path, percent, operation)
+
+    def take_progress(self):
+        """Return the update stored since the last call, or None"""
+        with self._latest_lock:
+            latest, self._latest = self._latest, None
+        return latest
 
     @pyqtSlot()
     def run(self):
         """
-        Execute the transcription process using multiprocessing.
+        Execute the transcription on the shared model server thread.
         """
+        original_cores = None
+        if self.cores:
+            try:
+                # Pins this pool thread; the ffmpeg processes it starts
+                # inherit the same cores
+                original_cores = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, self.cores)
+            except OSError as e:
+                original_cores = None
+                print(f"Warning: Could not set CPU affinity: {e}")
+
         try:
             self.signals.started.emit(self.file_path)
             self.signals.log.emit(
                 f"Started processing {os.path.basename(self.file_path)}"
             )
 
-            # Create processor and process the file
-            self.processor = GUIProcessor(self.signals)
+            # Process the file
             self.processor.process_file(
                 self.file_path,
                 self.output_dir,
@@ -96,6 +235,9 @@ class TranscriptionWorker(QRunnable):
                 self.include_timestamps,
                 self.auto_clean,
                 self.keep_audio,
+                self.compute_type,
+                self.duration,
+                self.threads,
             )
 
         except Exception as e:
@@ -103,6 +245,13 @@ class TranscriptionWorker(QRunnable):
             self.signals.log.emit(
                 f"Error processing {os.path.basename(self.file_path)}: {str(e)}"
             )
+        finally:
+            # Pool threads are reused, so the next job starts unpinned
+            if original_cores is not None:
+                try:
+                    os.sched_setaffinity(0, original_cores)
+                except OSError as e:
+                    print(f"Warning: Could not restore CPU affinity: {e}")
 
 
 class MP4TranscriberGUI(QMainWindow):
@@ -114,44 +263,91 @@ class MP4TranscriberGUI(QMainWindow):
         super().__init__()
 
         self.threadpool = QThreadPool()
-        self.file_queue = []  # List of dicts with file info and status
+        # Extraction runs in these threads while the model server
+        # transcribes one file at a time; sized from the concurrency option
+        # when processing starts
+        self._entries = {}  # FileEntry for each queued file, by path
+        self._order = []  # Queued paths in table row order
         self.processing = False
-        self.current_file = None
-        self.current_worker = None  # Keep track of current worker
+        self.active_workers = {}  # Running workers by file path
+        self._pending = []  # FileEntry objects waiting for a free worker
+        self._last_opened = {}  # Output folder -> time it was last opened
+        # Thread that keeps the Whisper model loaded between files; it may
+        # call log_message, which only appends to a deque
+        self.model_worker = TranscriptionServer(on_log=self.log_message)
+
+        # Probe added files (duration, size) off the GUI thread. Each probe
+        # waits on an ffprobe process, so threads give full concurrency.
+        self.probe_executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 2)
+        )
+        self._probe_futures = []
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setInterval(100)
+        self._probe_timer.timeout.connect(self._collect_probes)
+
+        # Workers only store their latest progress; read it at 10 Hz instead
+        # of repainting on every update
+        self._ui_timer = QTimer(self)
+        self._ui_timer.timeout.connect(self._poll_workers)
+        self._ui_timer.start(100)
+
+        # Log lines are buffered and appended together on each tick, so a
+        # busy queue does not re-layout the log for every message
+        self._log_buffer = deque()
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(100)
 
         # Define path for quick paths config in project root
         self.config_file_path = "quick_paths.json"
         self.quick_paths = self._load_quick_paths()
+        self._isdir_cache = {}  # Quick path directory -> exists, per session
 
         self.init_ui()
 
+        # Load the model while the user is still adding files, and reload
+        # it whenever a different model or precision is picked
+        self.model_combo.currentTextChanged.connect(self._prewarm_model)
+        self.precision_combo.currentTextChanged.connect(self._prewarm_model)
+        QTimer.singleShot(0, self._prewarm_model)
+
     # Removed _get_config_path as it's no longer needed
 
     def _load_quick_paths(self):
         """Loads quick paths from quick_paths.json in the project root."""
-        if os.path.exists(self.config_file_path):
-            try:
-                with open(self.config_file_path, "r") as f:
-                    paths = json.load(f)
-                    if isinstance(paths, dict):
-                        print(f"Loaded quick paths from {self.config_file_path}")
-                        return paths
-                    else:
-                        print(
-                            f"Warning: Invalid format in {self.config_file_path}. Using empty paths."
-                        )
-                        # Show message box later in init_ui if needed, as UI isn't ready yet
-                        return {"error": "Invalid format"}  # Indicate error state
-            except (IOError, json.JSONDecodeError) as e:
-                print(
-                    f"Error loading quick paths from {self.config_file_path}: {e}. Using empty paths."
-                )
-                # Show message box later in init_ui if needed
-                return {"error": f"Load error: {e}"}  # Indicate error state
-        else:
+        # Open directly instead of checking existence first, one stat less
+        try:
+            with open(self.config_file_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
             print(f"Warning: {self.config_file_path} not found. No quick paths loaded.")
             # Return empty, message will be shown in init_ui
             return {}  # Return empty dict if file doesn't exist
+        except IOError as e:
+            print(
+                f"Error loading quick paths from {self.config_file_path}: {e}. Using empty paths."
+            )
+            # Show message box later in init_ui if needed
+            return {"error": f"Load error: {e}"}  # Indicate error state
+
+        try:
+            paths = orjson.loads(data) if orjson else json.loads(data)
+        except ValueError as e:  # Both decoders raise ValueError
+            print(
+                f"Error loading quick paths from {self.config_file_path}: {e}. Using empty paths."
+            )
+            return {"error": f"Load error: {e}"}  # Indicate error state
+
+        if not isinstance(paths, dict):
+            print(
+                f"Warning: Invalid format in {self.config_file_path}. Using empty paths."
+            )
+            # Show message box later in init_ui if needed, as UI isn't ready yet
+            return {"error": "Invalid format"}  # Indicate error state
+
+        print(f"Loaded quick paths from {self.config_file_path}")
+        return paths
 
     def _save_quick_paths(self, paths_to_save=None):
         """Saves the provided paths (or current self.quick_paths) to quick_paths.json."""
@@ -161,8 +357,11 @@ class MP4TranscriberGUI(QMainWindow):
             print("Skipping save due to previous load error.")
             return
         try:
-            with open(self.config_file_path, "w") as f:
-                json.dump(paths, f, indent=4)
+            with open(self.config_file_path, "wb") as f:
+                if orjson:
+                    f.write(orjson.dumps(paths, option=orjson.OPT_INDENT_2))
+                else:
+                    f.write(json.dumps(paths, indent=4).encode("utf-8"))
             print(f"Saved quick paths to {self.config_file_path}")
         except IOError as e:
             print(f"Error saving quick paths to {self.config_file_path}: {e}")
@@ -228,9 +427,9 @@ class MP4TranscriberGUI(QMainWindow):
         files_group.setAcceptDrops(True)
 
         self.files_table = QTableWidget(
-            0, 3
-        )  # Rows will be added dynamically, 3 columns
-        self.files_table.setHorizontalHeaderLabels(["✓", "File", "Status"])
+            0, 4
+        )  # Rows will be added dynamically, 4 columns
+        self.files_table.setHorizontalHeaderLabels(["✓", "File", "Duration", "Status"])
         self.files_table.horizontalHeader().setSectionResizeMode(
             1, QHeaderView.ResizeMode.Stretch
         )
@@ -251,6 +450,31 @@ class MP4TranscriberGUI(QMainWindow):
         self.model_combo.addItems(["tiny", "base", "small", "medium", "large"])
         self.model_combo.setCurrentText("medium")  # Changed default to medium
         model_layout.addWidget(self.model_combo)
+
+        # Weight precision (only used by the faster-whisper backend)
+        model_layout.addWidget(QLabel("Precision:"))
+        self.precision_combo = QComboBox()
+        self.precision_combo.addItems(COMPUTE_TYPES)
+        self.precision_combo.setCurrentText(DEFAULT_COMPUTE_TYPE)
+        self.precision_combo.setEnabled(self.model_worker.backend == "faster-whisper")
+        self.precision_combo.setToolTip(
+            "Weight precision for faster-whisper; int8 variants are fastest. "
+            "float16 types fall back to int8/float32 on CPU."
+        )
+        model_layout.addWidget(self.precision_combo)
+
+        # Number of files extracted at the same time
+        model_layout.addWidget(QLabel("Concurrent files:"))
+        self.max_concurrent = QSpinBox()
+        self.max_concurrent.setRange(1, QThread.idealThreadCount())
+        self.max_concurrent.setValue(
+            max(1, min(4, QThread.idealThreadCount() // 2))
+        )
+        self.max_concurrent.setToolTip(
+            "Files processed at once. Audio extraction runs in parallel, "
+            "transcription still uses one shared model."
+        )
+        model_layout.addWidget(self.max_concurrent)
         model_layout.addStretch()
         options_layout.addLayout(model_layout)
 
@@ -321,6 +545,7 @@ class MP4TranscriberGUI(QMainWindow):
 
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(MAX_LOG_LINES)
         logs_layout.addWidget(self.log_text)
 
         main_layout.addWidget(logs_group)
@@ -368,16 +593,23 @@ class MP4TranscriberGUI(QMainWindow):
         added_count = 0
         for file_path in file_paths:
             # Basic check for file extension
-            if file_path.lower().endswith((".mp4", ".mp3", ".m4a")):
+            if _is_media(file_path):
                 # Check if file is already in queue
-                if not any(item["path"] == file_path for item in self.file_queue):
-                    self.file_queue.append(
-                        {
-                            "path": file_path,
-                            "name": os.path.basename(file_path),
-                            "status": "Queued",
-                            "progress": 0,
-                        }
+                if file_path not in self._entries:
+                    self._entries[file_path] = FileEntry(
+                        path=file_path,
+                        name=os.path.basename(file_path),
+                        row=len(self._order),
+                        status="Queued",
+                        progress=0,
+                        duration=None,
+                        size=None,
+                        duration_item=None,
+                        status_item=None,
+                    )
+                    self._order.append(file_path)
+                    self._probe_futures.append(
+                        self.probe_executor.submit(probe_media, file_path)
                     )
                     added_count += 1
             else:
@@ -386,8 +618,33 @@ class MP4TranscriberGUI(QMainWindow):
                 )
 
         if added_count > 0:
-            self.update_files_table()
+            self._populate_table()
             self.log_message(f"Added {added_count} file(s) to queue")
+            self._probe_timer.start()
+
+    def _collect_probes(self):
+        """Fills in the duration of files whose probe has finished."""
+        pending = []
+        for future in self._probe_futures:
+            if not future.done():
+                pending.append(future)
+                continue
+
+            file_path, duration, size = future.result()
+            entry = self._entries.get(file_path)
+            if entry is not None:  # Not removed while being probed
+                entry.duration = duration
+                entry.size = size
+                entry.duration_item.setText(self._format_duration(duration))
+
+        self._probe_futures = pending
+        if not pending:
+            self._probe_timer.stop()
+
+    @staticmethod
+    def _format_duration(duration):
+        """Formats a probed duration for the files table."""
+        return format_timestamp(duration) if duration is not None else ""
 
     def add_files(self):
         """Open file dialog to add MP4/MP3 files to the queue, using quick path if selected"""
@@ -404,8 +661,12 @@ class MP4TranscriberGUI(QMainWindow):
                 selected_path_name, os.path.expanduser("~/Movies")
             )  # Fallback just in case
 
-        # Ensure the directory exists before opening the dialog
-        if not os.path.isdir(start_dir):
+        # Ensure the directory exists before opening the dialog; quick paths
+        # rarely change, so each is only checked once
+        if start_dir not in self._isdir_cache:
+            self._isdir_cache[start_dir] = os.path.isdir(start_dir)
+        if not self._isdir_cache[start_dir]:
+            del self._isdir_cache[start_dir]  # Check again next time
             self.log_message(
                 f"Warning: Quick path directory not found: {start_dir}. Falling back to Movies."
             )
@@ -416,6 +677,7 @@ class MP4TranscriberGUI(QMainWindow):
             "Select MP4/MP3 Files",
             start_dir,  # Use the determined start directory
             "Media Files (*.mp4 *.mp3 *.m4a);;MP4 Files (*.mp4);;MP3 Files (*.mp3);;M4A Files (*.m4a);;All Files (*)",
+            options=FAST_DIALOG_OPTIONS | QFileDialog.Option.ReadOnly,
         )
 
         if files:
@@ -444,15 +706,24 @@ class MP4TranscriberGUI(QMainWindow):
             new_paths = dialog.get_paths()
             if new_paths != valid_paths:  # Check if changes were actually made
                 self.quick_paths = new_paths
+                self._isdir_cache.clear()
                 self._save_quick_paths()
                 self._update_quick_path_combo()
                 self.log_message("Quick paths updated.")
 
-    def update_files_table(self):
-        """Update the files table with current queue contents"""
-        self.files_table.setRowCount(len(self.file_queue))
+    def _populate_table(self):
+        """Add table rows for files appended to the queue since the last update"""
+        first_new_row = self.files_table.rowCount()
+
+        # Lay the table out once for the whole batch instead of per cell
+        self.files_table.setUpdatesEnabled(False)
+        self.files_table.blockSignals(True)
+        self.files_table.setRowCount(len(self._order))
+        self.files_table.blockSignals(False)
+
+        for row in range(first_new_row, len(self._order)):
+            entry = self._entries[self._order[row]]
 
-        for row, file_info in enumerate(self.file_queue):
             # Checkbox column
             checkbox = QTableWidgetItem()
             checkbox.setFlags(
@@ -462,14 +733,32 @@ class MP4TranscriberGUI(QMainWindow):
             self.files_table.setItem(row, 0, checkbox)
 
             # File name column
-            name_item = QTableWidgetItem(file_info["name"])
+            name_item = QTableWidgetItem(entry.name)
             name_item.setFlags(name_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
             self.files_table.setItem(row, 1, name_item)
 
+            # Duration column
+            duration_item = QTableWidgetItem(
+                self._format_duration(entry.duration)
+            )
+            duration_item.setFlags(duration_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+            self.files_table.setItem(row, 2, duration_item)
+
             # Status column
-            status_item = QTableWidgetItem(file_info["status"])
+            status_item = QTableWidgetItem(entry.status)
             status_item.setFlags(status_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.files_table.setItem(row, 2, status_item)
+            self.files_table.setItem(row, 3, status_item)
+
+            # Keep the items so later updates only touch the changed cell
+            entry.duration_item = duration_item
+            entry.status_item = status_item
+
+        self.files_table.setUpdatesEnabled(True)
+
+    def _set_status(self, entry, status):
+        """Update the status of a single queued file and its table cell"""
+        entry.status = status
+        entry.status_item.setText(status)
 
     def remove_selected(self):
         """Remove selected files from the queue"""
@@ -481,16 +770,26 @@ class MP4TranscriberGUI(QMainWindow):
 
         # Remove from highest index to lowest to avoid index shifting issues
         for row in sorted(selected_rows, reverse=True):
-            file_name = self.file_queue[row]["name"]
-            self.file_queue.pop(row)
-            self.log_message(f"Removed {file_name} from queue")
+            entry = self._entries.pop(self._order.pop(row))
+            self.files_table.removeRow(row)
+            self.log_message(f"Removed {entry.name} from queue")
+
+        # Files waiting for a worker must not be started once removed
+        if selected_rows and self._pending:
+            self._pending = [e for e in self._pending if self._entries.get(e.path) is e]
 
-        self.update_files_table()
+        # Rows after the removed ones have moved up
+        if selected_rows:
+            for row, path in enumerate(self._order[min(selected_rows):], min(selected_rows)):
+                self._entries[path].row = row
 
     def browse_output(self):
         """Open folder dialog to select output directory"""
         folder = QFileDialog.getExistingDirectory(
-            self, "Select Output Folder", self.output_edit.text()
+            self,
+            "Select Output Folder",
+            self.output_edit.text(),
+            FAST_DIALOG_OPTIONS | QFileDialog.Option.ShowDirsOnly,
         )
 
         if folder:
@@ -519,6 +818,8 @@ class MP4TranscriberGUI(QMainWindow):
 
         # Disable options while processing
         self.model_combo.setEnabled(False)
+        self.precision_combo.setEnabled(False)
+        self.max_concurrent.setEnabled(False)
         self.timestamps_cb.setEnabled(False)
         self.clean_cb.setEnabled(False)
         self.keep_audio_cb.setEnabled(False)
@@ -526,8 +827,31 @@ class MP4TranscriberGUI(QMainWindow):
         self.output_edit.setEnabled(False)
         self.browse_btn.setEnabled(False)
 
-        # Start processing the first file
-        self.process_next_file()
+        # Normally already loaded by _prewarm_model; this only restarts the
+        # server if it has died since
+        self.model_worker.start(
+            self.model_combo.currentText(), self._selected_compute_type()
+        )
+
+        # Start processing the checked files
+        self.process_checked_files()
+
+    def _prewarm_model(self, *_):
+        """Start the model server with the selected model in the background"""
+        if self.processing:
+            return
+        self.model_worker.start(
+            self.model_combo.currentText(), self._selected_compute_type()
+        )
+        self.log_message(
+            f"Loading {self.model_combo.currentText()} model in the background"
+        )
+
+    def _selected_compute_type(self):
+        """Returns the chosen precision, or None when the backend ignores it."""
+        if self.model_worker.backend != "faster-whisper":
+            return None
+        return self.precision_combo.currentText()
 
     def stop_processing(self):
         """Stop the processing queue"""
@@ -537,6 +861,8 @@ class MP4TranscriberGUI(QMainWindow):
 
         # Re-enable options
         self.model_combo.setEnabled(True)
+        self.precision_combo.setEnabled(self.model_worker.backend == "faster-whisper")
+        self.max_concurrent.setEnabled(True)
         self.timestamps_cb.setEnabled(True)
         self.clean_cb.setEnabled(True)
         self.keep_audio_cb.setEnabled(True)
@@ -548,160 +874,207 @@ class MP4TranscriberGUI(QMainWindow):
         self.current_file_label.setText("Processing stopped")
         self.current_operation_label.setText("")
 
-        # Terminate any running processes
-        if (
-            self.current_worker
-            and hasattr(self.current_worker, "processor")
-            and self.current_worker.processor
-        ):
+        # Clear queued workers first so none of them starts the model again
+        self._pending.clear()
+        self.threadpool.clear()
+
+        # Cancel any running transcriptions
+        for worker in self.active_workers.values():
             try:
-                self.current_worker.processor.terminate()
+                worker.processor.terminate()
             except Exception:
                 pass
+        self.active_workers.clear()
 
-        # Also try to clear the thread pool
-        self.threadpool.clear()
+    def process_checked_files(self):
+        """Queue every checked file and start the first batch of workers"""
+        checked = [
+            self._entries[path]
+            for row, path in enumerate(self._order)
+            if self.files_table.item(row, 0).checkState() == Qt.CheckState.Checked
+        ]
 
-    def process_next_file(self):
-        """Process the next file in the queue"""
-        # Find next checked file regardless of status
-        next_file = None
-        next_index = -1
-
-        for i, file_info in enumerate(self.file_queue):
-            # Check if the file is checked in the table
-            if self.files_table.item(i, 0).checkState() == Qt.CheckState.Checked:
-                next_file = file_info
-                next_index = i
-                break
+        for entry in checked:
+            self._set_status(entry, "Queued")
+            self._pending.append(entry)
 
-        if next_file is None:
-            # No more files to process
-            self.processing = False
-            self.stop_btn.setEnabled(False)
-            self.start_btn.setEnabled(True)
-
-            # Re-enable options
-            self.model_combo.setEnabled(True)
-            self.timestamps_cb.setEnabled(True)
-            self.clean_cb.setEnabled(True)
-            self.keep_audio_cb.setEnabled(True)
-            self.output_edit.setEnabled(True)
-            self.browse_btn.setEnabled(True)
-
-            self.current_file_label.setText("All checked files processed")
-            self.current_operation_label.setText("")
-            self.progress_bar.setValue(0)
-            self.log_message("Queue processing completed")
-            return
+        max_concurrent = self.max_concurrent.value()
+        self.threadpool.setMaxThreadCount(max_concurrent)
+        while len(self.active_workers) < max_concurrent and self._launch_one():
+            pass
+
+        self.current_file_label.setText(f"Processing {len(checked)} file(s)")
 
-        # Set current file
-        self.current_file = next_file
-        self.current_file_label.setText(f"Processing {next_file['name']}")
+    def _launch_one(self):
+        """Start a worker for the next queued file; False if none is left"""
+        if not self.processing or not self._pending:
+            return False
+        entry = self._pending.pop(0)
 
-        # Update table
-        self.file_queue[next_index]["status"] = "Processing 0%"
-        self.update_files_table()
+        # Share the cores between the files being extracted at once
+        max_concurrent = self.max_concurrent.value()
+        ffmpeg_threads = max(1, QThread.idealThreadCount() // max_concurrent)
+
+        # Give the job the lowest free slot, so its core block is unused
+        used_slots = {w.job_index for w in self.active_workers.values()}
+        job_index = next(i for i in range(max_concurrent + 1) if i not in used_slots)
 
         # Create worker
         worker = TranscriptionWorker(
-            next_file["path"],
+            entry.path,
             self.output_edit.text(),
             self.model_combo.currentText(),
+            self._selected_compute_type(),
             self.timestamps_cb.isChecked(),
             self.clean_cb.isChecked(),
             self.keep_audio_cb.isChecked(),
             self.open_folder_cb.isChecked(),  # Pass checkbox state
+            self.model_worker,
+            entry.duration,
+            ffmpeg_threads,
+            job_index,
+            affinity_cores(job_index, max_concurrent),
         )
 
-        # Connect signals
-        worker.signals.started.connect(self.on_worker_started)
-        worker.signals.progress.connect(self.on_worker_progress)
-        worker.signals.completed.connect(self.on_worker_completed)
-        worker.signals.error.connect(self.on_worker_error)
-        worker.signals.log.connect(self.log_message)
-
-        # Store current worker reference
-        self.current_worker = worker
+        # Connect signals; queued, since they are emitted from pool threads
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.signals.started.connect(self.on_worker_started, queued)
+        worker.signals.completed.connect(self.on_worker_completed, queued)
+        worker.signals.error.connect(self.on_worker_error, queued)
+        worker.signals.log.connect(self.log_message, queued)
 
-        # Execute
+        # Keep track of the worker until it finishes
+        self.active_workers[entry.path] = worker
         self.threadpool.start(worker)
+        return True
+
+    def _finish_file(self, file_path):
+        """Forget a finished worker, start the next file and wrap up once none are left"""
+        self.active_workers.pop(file_path, None)
+        self._launch_one()
+        if not self.processing or self.active_workers:
+            return
+
+        # No more files to process
+        self.processing = False
+        self.stop_btn.setEnabled(False)
+        self.start_btn.setEnabled(True)
+
+        # Re-enable options
+        self.model_combo.setEnabled(True)
+        self.precision_combo.setEnabled(self.model_worker.backend == "faster-whisper")
+        self.max_concurrent.setEnabled(True)
+        self.timestamps_cb.setEnabled(True)
+        self.clean_cb.setEnabled(True)
+        self.keep_audio_cb.setEnabled(True)
+        self.open_folder_cb.setEnabled(True)
+        self.output_edit.setEnabled(True)
+        self.browse_btn.setEnabled(True)
+
+        self.current_file_label.setText("All checked files processed")
+        self.current_operation_label.setText("")
+        self.progress_bar.setValue(0)
+        self.log_message("Queue processing completed")
+
+    def _poll_workers(self):
+        """Apply the latest progress of each active worker"""
+        for worker in list(self.active_workers.values()):
+            latest = worker.take_progress()
+            if latest is not None:
+                self.on_worker_progress(*latest)
 
     def on_worker_started(self, file_path):
         """Handle worker started signal"""
-        pass  # Already handled in the process_next_file method
+        pass  # Already handled in the process_checked_files method
 
     def on_worker_progress(self, file_path, progress, operation):
         """Handle worker progress signal"""
-        # Find the file in the queue
-        for i, file_info in enumerate(self.file_queue):
-            if file_info["path"] == file_path:
-                self.file_queue[i]["status"] = f"Processing {progress}%"
-                self.file_queue[i]["progress"] = progress
-                self.update_files_table()
-                break
+        entry = self._entries.get(file_path)
+        if entry is not None and entry.progress != progress:
+            entry.progress = progress
+            self._set_status(entry, f"Processing {progress}%")
 
         self.progress_bar.setValue(progress)
         self.current_operation_label.setText(operation)
 
     def on_worker_completed(self, file_path):
         """Handle worker completed signal"""
-        # Find the file in the queue
-        for i, file_info in enumerate(self.file_queue):
-            if file_info["path"] == file_path:
-                self.file_queue[i]["status"] = "Completed"
-                self.update_files_table()
-
-                # Open output folder if checked
-                if self.open_folder_cb.isChecked():
-                    output_dir = self.output_edit.text()
-                    if os.path.isdir(output_dir):
-                        try:
-                            if sys.platform == "win32":
-                                os.startfile(output_dir)
-                            elif sys.platform == "darwin":  # macOS
-                                subprocess.run(["open", output_dir], check=True)
-                            else:  # Linux and other Unix-like
-                                subprocess.run(["xdg-open", output_dir], check=True)
-                            self.log_message(f"Opened output folder: {output_dir}")
-                        except Exception as e:
-                            self.log_message(f"Error opening output folder: {e}")
-                    else:
-                        self.log_message(
-                            f"Output folder not found or is not a directory: {output_dir}"
-                        )
-                break
+        entry = self._entries.get(file_path)
+        if entry is not None:
+            self._set_status(entry, "Completed")
 
-        if self.processing:
-            # Start the next file
-            self.process_next_file()
+            # Open output folder if checked
+            if self.open_folder_cb.isChecked():
+                self._open_output_folder(self.output_edit.text())
+
+        self._finish_file(file_path)
+
+    def _open_output_folder(self, output_dir):
+        """Show the output folder, unless it was just opened for another file"""
+        now = time.monotonic()
+        if now - self._last_opened.get(output_dir, -FOLDER_REOPEN_INTERVAL) < FOLDER_REOPEN_INTERVAL:
+            return
+
+        if not os.path.isdir(output_dir):
+            self.log_message(
+                f"Output folder not found or is not a directory: {output_dir}"
+            )
+            return
+
+        try:
+            if sys.platform == "win32":
+                os.startfile(output_dir)
+            else:
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                # Don't wait for the file manager, it may keep running
+                subprocess.Popen(
+                    [opener, output_dir],
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            self._last_opened[output_dir] = now
+            self.log_message(f"Opened output folder: {output_dir}")
+        except Exception as e:
+            self.log_message(f"Error opening output folder: {e}")
 
     def on_worker_error(self, file_path, error_msg):
         """Handle worker error signal"""
-        # Only log errors that aren't related to stopping the process
+        # Only log errors that aren't related to stopping the transcription
         if (
             "terminated" not in error_msg.lower()
             and "cancelled" not in error_msg.lower()
         ):
-            # Find the file in the queue
-            for i, file_info in enumerate(self.file_queue):
-                if file_info["path"] == file_path:
-                    self.file_queue[i]["status"] = "Error"
-                    self.update_files_table()
-                    break
+            entry = self._entries.get(file_path)
+            if entry is not None:
+                self._set_status(entry, "Error")
 
             self.log_message(
                 f"Error processing {os.path.basename(file_path)}: {error_msg}"
             )
 
-        if self.processing:
-            # Continue with the next file
-            self.process_next_file()
+        self._finish_file(file_path)
 
     def log_message(self, message):
         """Add a message to the log with timestamp"""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        self.log_text.append(f"{timestamp} - {message}")
+        self._log_buffer.append(f"{timestamp} - {message}")
+
+    def _flush_log(self):
+        """Append all buffered log messages in one edit"""
+        if not self._log_buffer:
+            return
+        lines = []
+        while self._log_buffer:
+            lines.append(self._log_buffer.popleft())
+        text = "\n".join(lines)
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+
+        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.log_text.insertPlainText(text)
+        self.log_text.ensureCursorVisible()
 
     # --- Drag and Drop Event Handlers ---
 
@@ -709,26 +1082,51 @@ class MP4TranscriberGUI(QMainWindow):
         """Handle drag enter event."""
         # Check if the event contains URLs
         if event.mimeData().hasUrls():
-            # Check if any URL is an MP4 or MP3 file
-            for url in event.mimeData().urls():
-                if url.isLocalFile() and url.toLocalFile().lower().endswith(
-                    (".mp4", ".mp3", ".m4a")
-                ):
-                    event.acceptProposedAction()
-                    return
+            # Check if any URL is a media file or a folder
+            if any(
+                _is_media(url.toLocalFile()) or os.path.isdir(url.toLocalFile())
+                for url in event.mimeData().urls()
+                if url.isLocalFile()
+            ):
+                event.acceptProposedAction()
+                return
         event.ignore()
 
     def dropEvent(self, event):
         """Handle drop event."""
         files = []
+        directories = []
         for url in event.mimeData().urls():
             if url.isLocalFile():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith((".mp4", ".mp3", ".m4a")):
+                if _is_media(file_path):
                     files.append(file_path)
+                elif os.path.isdir(file_path):
+                    directories.append(file_path)
 
-        if files:
-            self._add_file_paths(files)
+        if files or directories:
             event.acceptProposedAction()
+            if files:
+                self._add_file_paths(files)
+            for directory in directories:
+                self._add_directory(directory)
         else:
             event.ignore()
+
+    def _add_directory(self, directory, batch_size=100):
+        """Adds the media files of a directory while it is being listed."""
+        it = QDirIterator(
+            directory,
+            ["*.mp4", "*.mp3", "*.m4a"],
+            QDir.Filter.Files | QDir.Filter.NoDotAndDotDot,
+        )
+        batch = []
+        while it.hasNext():
+            batch.append(it.next())
+            if len(batch) >= batch_size:
+                self._add_file_paths(batch)
+                batch = []
+                # Keep the window responsive while a large folder is listed
+                QApplication.processEvents()
+        if batch:
+            self._add_file_paths(batch)
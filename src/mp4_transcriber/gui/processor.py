@@ -3,107 +3,369 @@ Integration between GUI and mp4_transcriber backend.
 """
 import os
 import json
+import queue
 import traceback
-import multiprocessing
 from pathlib import Path
-import signal
 import sys
+import threading
 
-from mp4_transcriber.audio import extract_audio
-from mp4_transcriber.transcription import transcribe_audio, create_transcript_with_timestamps
+from mp4_transcriber.audio import extract_audio, extract_audio_to_array
+from mp4_transcriber.transcription import (
+    DEFAULT_BACKEND,
+    DEFAULT_BATCH_SIZE,
+    load_model,
+    warmup_model,
+    transcribe_audio,
+    create_transcript_with_timestamps,
+    TranscriptionCancelled,
+)
 from mp4_transcriber.text_processing import clean_transcript
+from mp4_transcriber.cache import cache_key, load_result, store_result
 
-# Global process reference for termination
-current_process = None
+# Most updates taken off the progress queue before they are forwarded
+MAX_DRAIN = 64
 
-def transcription_worker(file_path, output_path, model_size, with_timestamps, auto_clean, 
-                         result_queue, progress_queue):
+def save_transcript(result, output_path, with_timestamps, auto_clean, log):
     """
-    Worker function to run in a separate process for transcription.
+    Format a transcription result and write it to the output file.
+    
+    Args:
+        result: Transcription result with 'text' and 'segments'
+        output_path: Path of the transcript to write
+        with_timestamps: Whether to include timestamps in the transcript
+        auto_clean: Whether to clean up the transcript
+        log: Callable that receives log messages
     """
+    # Process transcript, writing it to a temporary file as it is formatted
+    # and publishing it atomically once complete
+    tmp_path = f"{output_path}.tmp"
     try:
-        # Extract audio
-        progress_queue.put(("log", f"Extracting audio from {os.path.basename(file_path)}"))
-        progress_queue.put(("progress", 5, "Starting audio extraction..."))
-        
-        audio_path = extract_audio(file_path, verbose=True)
-        if not audio_path:
-            progress_queue.put(("log", "Failed to extract audio"))
-            progress_queue.put(("error", "Failed to extract audio"))
-            return
-            
-        progress_queue.put(("progress", 30, "Audio extraction complete"))
-        progress_queue.put(("log", f"Transcribing with {model_size} model..."))
-        progress_queue.put(("progress", 35, f"Starting transcription with {model_size} model..."))
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            try:
+                if with_timestamps:
+                    create_transcript_with_timestamps(result['segments'], f)
+                    log("Added timestamps to transcript")
+                else:
+                    if auto_clean:
+                        f.write(clean_transcript(result))
+                        log("Cleaned transcript text")
+                    else:
+                        f.write(result.get('text', ''))
+            except Exception as e:
+                log(f"Warning: Error during transcript formatting: {str(e)}")
+                # Fallback to raw text
+                transcript = result.get('text', '')
+                log("Using raw transcript text without formatting.")
+                
+                # Basic cleanup
+                transcript = transcript.strip()
+                
+                # Replace anything written before the error
+                f.seek(0)
+                f.truncate()
+                f.write(transcript)
+        os.replace(tmp_path, output_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
         
-        # Transcribe
-        result = transcribe_audio(audio_path, model_size, True)
+    log(f"Transcript saved to {output_path}")
+
+def transcription_worker(model, audio, output_path, model_size, with_timestamps, auto_clean, 
+                         key, progress_queue, cancel_event=None):
+    """
+    Transcribe already extracted audio with an already loaded model.
+    
+    Every job ends with a ("__done__", None) message on the progress queue,
+    whether it completed, failed or was cancelled through ``cancel_event``.
+    A ("progress_log", percent, message) update stands for both a log line
+    and a progress update with the same message.
+    """
+    try:
+        progress_queue.put(("progress_log", 35, f"Transcribing with {model_size} model..."))
         
-        progress_queue.put(("progress", 80, "Transcription complete"))
-        progress_queue.put(("log", "Processing transcript..."))
-        progress_queue.put(("progress", 85, "Processing transcript..."))
+        # Transcribe
+        result = transcribe_audio(
+            audio,
+            model_size,
+            True,
+            model=model,
+            batch_size=DEFAULT_BATCH_SIZE,
+            cancel_event=cancel_event
+        )
+        if key:
+            store_result(key, result)
         
-        # Process transcript
-        try:
-            if with_timestamps:
-                transcript = create_transcript_with_timestamps(result['segments'])
-                progress_queue.put(("log", "Added timestamps to transcript"))
-            else:
-                if auto_clean:
-                    transcript = clean_transcript(result)
-                    progress_queue.put(("log", "Cleaned transcript text"))
-                else:
-                    transcript = result.get('text', '')
-        except Exception as e:
-            progress_queue.put(("log", f"Warning: Error during transcript formatting: {str(e)}"))
-            # Fallback to raw text
-            transcript = result.get('text', '')
-            progress_queue.put(("log", "Using raw transcript text without formatting."))
-            
-            # Basic cleanup
-            transcript = transcript.strip()
-            if transcript and transcript[0].islower():
-                transcript = transcript[0].upper() + transcript[1:]
+        # Keep only what the transcript needs so token lists and other
+        # per-segment data can be freed before formatting
+        if with_timestamps:
+            result = {
+                'text': result['text'],
+                'segments': [
+                    {'start': s['start'], 'end': s['end'], 'text': s['text']}
+                    for s in result['segments']
+                ],
+            }
+        else:
+            result = {'text': result['text']}
         
-        # Save transcript
+        progress_queue.put(("progress", 80, "Transcription complete"))
+        progress_queue.put(("progress_log", 85, "Processing transcript..."))
         progress_queue.put(("progress", 90, "Saving transcript..."))
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(transcript)
-            
-        progress_queue.put(("log", f"Transcript saved to {output_path}"))
+        save_transcript(
+            result,
+            output_path,
+            with_timestamps,
+            auto_clean,
+            lambda message: progress_queue.put(("log", message))
+        )
         progress_queue.put(("progress", 100, "Completed"))
         
-        # Cleanup audio file if needed
-        if not auto_clean and audio_path and os.path.exists(audio_path):
-            os.unlink(audio_path)
-            progress_queue.put(("log", "Cleaned up temporary audio file"))
-        
         # Signal completion
-        result_queue.put(("completed", output_path))
+        progress_queue.put(("completed", output_path))
         
+    except TranscriptionCancelled as e:
+        progress_queue.put(("error", str(e)))
+    except Exception as e:
+        # The traceback goes to the GUI log, stderr is usually not visible
+        progress_queue.put(("log", f"Error: {str(e)}\n{traceback.format_exc().rstrip()}"))
+        progress_queue.put(("error", str(e)))
+    finally:
+        progress_queue.put(("__done__", None))
+
+def _load_server_model(model_size, backend, compute_type, progress_queue, log=print):
+    """
+    Load and warm up the server's model, returning None if that failed.
+    
+    The outcome goes to ``log`` straight away, since a background load
+    may finish before any job reads the progress queue; a waiting job
+    still gets the error through the queue.
+    """
+    try:
+        model = load_model(model_size, True, backend, compute_type=compute_type)
+        warmup_model(model)
+        log(f"Loaded {model_size} model using {backend}")
+        return model
     except Exception as e:
-        progress_queue.put(("log", f"Error: {str(e)}"))
+        log(f"Error loading {model_size} model: {str(e)}\n{traceback.format_exc().rstrip()}")
         progress_queue.put(("error", str(e)))
-        traceback.print_exc()
+        progress_queue.put(("__done__", None))
+        return None
+
+def transcription_server(model_size, backend, compute_type, job_queue, progress_queue,
+                         cancel_event, previous=None, affinity=None, log=print):
+    """
+    Long-running thread that loads the Whisper model once and then
+    handles every message put on the job queue until it receives None or
+    ``cancel_event`` is set.
+    
+    Messages are ("transcribe", audio, output_path, model_size,
+    with_timestamps, auto_clean, key) jobs, or ("reload", model_size,
+    compute_type) to swap the model without restarting the thread.
+    
+    ``previous`` is the server thread this one replaces. It is waited for
+    before loading, because load_model hands out the same cached model
+    and an OpenAI Whisper model must not run two transcriptions at once.
+    
+    ``affinity`` is the set of CPUs the thread should run on. Threads
+    inherit the affinity of the thread that starts them, which may be a
+    worker pinned to one job's cores. Model loading is reported to ``log``.
+    """
+    if affinity:
+        try:
+            os.sched_setaffinity(0, affinity)
+        except OSError as e:
+            print(f"Warning: Could not set CPU affinity: {e}")
+    
+    if previous is not None:
+        previous.join()
+    
+    model = _load_server_model(model_size, backend, compute_type, progress_queue, log)
+    if model is None:
+        return
+    
+    for message in iter(job_queue.get, None):
+        if cancel_event.is_set():
+            return
+        if message[0] == "reload":
+            _, model_size, compute_type = message
+            # Drop this reference first; load_model keeps the old model
+            # cached only while it is one of the two most recently used
+            model = None
+            model = _load_server_model(model_size, backend, compute_type, progress_queue, log)
+            if model is None:
+                return
+        else:
+            transcription_worker(model, *message[1:], progress_queue, cancel_event)
+
+class TranscriptionServer:
+    """
+    Owns the thread that keeps a Whisper model loaded between files.
+    
+    The model lives in the GUI process, so audio arrays are handed over
+    without pickling and nothing is re-imported. Inference releases the GIL,
+    which keeps the interface responsive while a file is transcribed.
+    
+    The server transcribes one job at a time; hold ``lock`` while submitting
+    a job and monitoring it so concurrent workers take turns on the model.
+    ``memory_slot`` is held by the one worker allowed to keep decoded audio
+    in memory while it waits for ``lock``.
+    """
+    def __init__(self, on_log=print):
+        """
+        Args:
+            on_log: Callable that receives model loading messages; it is
+                called from the server thread
+        """
+        self.on_log = on_log
+        self.lock = threading.Semaphore(1)
+        self.memory_slot = threading.Semaphore(1)
+        # The batched CTranslate2 backend when it is installed
+        self.backend = DEFAULT_BACKEND
+        self.model_size = None
+        self.compute_type = None
+        self.thread = None
+        # Last stopped thread, which may still be finishing a job
+        self._stopped_thread = None
+        self.cancel_event = None
+        self.job_queue = None
+        self.progress_queue = None
+        # CPUs for the server thread, read here on the GUI thread since
+        # the pool threads that may restart the server can be pinned
+        self.affinity = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else None
+        
+    def is_alive(self):
+        """
+        Check whether the server thread is running.
+        """
+        return self.thread is not None and self.thread.is_alive()
+        
+    def start(self, model_size, compute_type=None):
+        """
+        Make sure a server with the given model is running. A running
+        server is asked to reload when the model or precision changed; a
+        new thread is only started if none is running.
+        
+        Args:
+            model_size: Whisper model name to keep loaded
+            compute_type: Weight precision for the faster-whisper backend
+        """
+        if self.is_alive():
+            if self.model_size != model_size or self.compute_type != compute_type:
+                # Handled after any queued jobs, which still use the old model
+                self.job_queue.put(("reload", model_size, compute_type))
+                self.model_size = model_size
+                self.compute_type = compute_type
+            return
+        self.stop()
+        # A stopped server may still be finishing a job on the cached model
+        previous = self._stopped_thread
+        
+        self.model_size = model_size
+        self.compute_type = compute_type
+        # One producer and one consumer each: SimpleQueue skips the
+        # condition variables and task tracking of queue.Queue
+        self.job_queue = queue.SimpleQueue()
+        self.progress_queue = queue.SimpleQueue()
+        self.cancel_event = threading.Event()
+        
+        self.thread = threading.Thread(
+            target=transcription_server,
+            args=(
+                model_size,
+                self.backend,
+                compute_type,
+                self.job_queue,
+                self.progress_queue,
+                self.cancel_event,
+                previous,
+                self.affinity,
+                self.on_log
+            ),
+            # Set as daemon so it does not keep the application alive
+            daemon=True
+        )
+        self.thread.start()
+        
+    def submit(self, audio, output_path, with_timestamps, auto_clean, key=None):
+        """
+        Queue extracted audio (samples or a file path) for transcription.
+        The result is cached under ``key`` if one is given.
+        """
+        self.job_queue.put(
+            ("transcribe", audio, output_path, self.model_size, with_timestamps, auto_clean, key)
+        )
+        
+    def stop(self):
+        """
+        Ask the server to exit once its current job is finished.
+        
+        The thread is not waited for here, so the GUI never blocks on it; a
+        server started afterwards waits for it before using the model.
+        """
+        if self.is_alive():
+            self.job_queue.put(None)
+        if self.thread is not None:
+            self._stopped_thread = self.thread
+        self.thread = None
+        
+    def terminate(self):
+        """
+        Cancel the running job and stop the server.
+        
+        Threads cannot be killed, so the job stops at the next point where
+        the transcription checks the cancel event.
+        """
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        self.stop()
 
 class GUIProcessor:
     """
     Wrapper for mp4_transcriber functionality that reports progress back to the GUI.
     """
-    def __init__(self, signals):
+    def __init__(self, signals, server, on_progress):
         """
         Initialize with signal handlers from the worker.
         
         Args:
-            signals: WorkerSignals instance for reporting progress
+            signals: WorkerSignals instance for logs, errors and completion
+            server: TranscriptionServer that holds the loaded model
+            on_progress: Callable(file_path, percent, message) that stores
+                the latest progress, which the GUI polls instead of
+                receiving a signal for every update
         """
         self.signals = signals
-        self.process = None
+        self.server = server
+        self.on_progress = on_progress
+        # Set by terminate; stops extraction and the transcription
+        self.cancel_event = threading.Event()
+        
+    def report_progress(self, file_path, percent, message):
+        """
+        Report progress through the callback.
+        
+        Args:
+            file_path: Path to the file being processed
+            percent: Progress percentage
+            message: Description of the current operation
+        """
+        self.on_progress(file_path, percent, message)
         
-    def process_file(self, file_path, output_dir, model_name, include_timestamps, auto_clean, keep_audio):
+    def process_file(self, file_path, output_dir, model_name, include_timestamps, auto_clean, keep_audio,
+                     compute_type=None, duration=None, threads=0):
         """
-        Process a single MP4 file with progress reporting using multiprocessing.
+        Process a single MP4 file with progress reporting using the model server.
+        
+        Audio is extracted in the calling thread, so several files can be
+        extracted while the server is busy transcribing another one. One of
+        them is decoded into memory; the others are extracted to temporary
+        files, so waiting files do not each hold their whole audio in RAM.
+        terminate kills a running extraction and stops waiting for the model.
+        
+        Every call ends with exactly one completed or error signal for
+        ``file_path``, including when it is cancelled.
         
         Args:
             file_path: Path to the MP4 file
@@ -112,119 +374,242 @@ class GUIProcessor:
             include_timestamps: Whether to include timestamps in the transcript
             auto_clean: Whether to clean up the transcript
             keep_audio: Whether to keep the temporary audio file
+            compute_type: Weight precision for the faster-whisper backend
+            duration: Length of the file in seconds, if already probed
+            threads: ffmpeg threads for extraction, 0 to let ffmpeg decide
         """
         try:
+            if self.cancel_event.is_set():
+                self.signals.error.emit(file_path, "Processing cancelled")
+                return
+            
+            source = Path(file_path)
+            output_dir = Path(output_dir)
+            
             # Create output dir if it doesn't exist
-            os.makedirs(output_dir, exist_ok=True)
+            output_dir.mkdir(parents=True, exist_ok=True)
             
             # Generate output filename
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
-            output_file = os.path.join(output_dir, f"{base_name}.txt")
-            
-            # Create queues for process communication
-            result_queue = multiprocessing.Queue()
-            progress_queue = multiprocessing.Queue()
+            output_file = output_dir / f"{source.stem}.txt"
             
-            # Create and start process
-            self.process = multiprocessing.Process(
-                target=transcription_worker,
-                args=(
-                    file_path,
+            # Reuse an earlier transcription of the same file and settings
+            try:
+                key = cache_key(file_path, model_name, self.server.backend, compute_type)
+            except OSError:
+                key = None
+            cached = load_result(key) if key else None
+            if cached is not None:
+                self.signals.log.emit(f"Using cached transcription of {source.name}")
+                self.report_progress(file_path, 90, "Saving transcript...")
+                save_transcript(
+                    cached,
                     output_file,
-                    model_name,
                     include_timestamps,
                     auto_clean,
-                    result_queue,
-                    progress_queue
+                    self.signals.log.emit
                 )
-            )
+                self.report_progress(file_path, 100, "Completed")
+                self.signals.completed.emit(file_path)
+                return
             
-            # Set as daemon so it terminates when main process exits
-            self.process.daemon = True
-            self.process.start()
+            # Extract audio
+            self.signals.log.emit(f"Extracting audio from {source.name}")
+            self.report_progress(file_path, 5, "Starting audio extraction...")
             
-            global current_process
-            current_process = self.process
+            def on_extract_progress(percent):
+                # Extraction covers 5-30% of the overall progress
+                self.report_progress(file_path, 5 + int(percent * 0.25), "Extracting audio...")
             
-            # Monitor queues until process completes or is terminated
-            self.monitor_process(file_path, self.process, result_queue, progress_queue)
+            # Only one file may wait for the model with its audio in memory;
+            # other files extracted meanwhile go to a temporary file
+            in_memory = not keep_audio and self.server.memory_slot.acquire(blocking=False)
+            temp_audio = None
+            try:
+                if keep_audio:
+                    # Write the audio next to the transcript so it can be kept
+                    audio = extract_audio(
+                        file_path,
+                        str(output_file.with_suffix('.wav')),
+                        verbose=True,
+                        progress_callback=on_extract_progress,
+                        total_duration=duration,
+                        threads=threads,
+                        cancel_event=self.cancel_event
+                    )
+                elif in_memory:
+                    # Decode straight into memory, no temporary file needed
+                    audio = extract_audio_to_array(
+                        file_path,
+                        progress_callback=on_extract_progress,
+                        total_duration=duration,
+                        threads=threads,
+                        cancel_event=self.cancel_event
+                    )
+                else:
+                    audio = extract_audio(
+                        file_path,
+                        progress_callback=on_extract_progress,
+                        total_duration=duration,
+                        threads=threads,
+                        cancel_event=self.cancel_event
+                    )
+                    # The input itself is returned when it needs no extraction
+                    if audio is not None and audio != file_path:
+                        temp_audio = audio
+                if self.cancel_event.is_set():
+                    self.signals.error.emit(file_path, "Processing cancelled")
+                    return
+                if audio is None:
+                    self.signals.log.emit("Failed to extract audio")
+                    self.signals.error.emit(file_path, "Failed to extract audio")
+                    return
+                
+                self.report_progress(file_path, 30, "Audio extraction complete, waiting for model...")
+                
+                # Only one file is transcribed at a time
+                if not self._wait_for_model():
+                    self.signals.error.emit(file_path, "Processing cancelled")
+                    return
+            finally:
+                # Handed over to the model (or failed), so another file may
+                # take the in-memory slot
+                if in_memory:
+                    self.server.memory_slot.release()
+                if temp_audio is not None and self.cancel_event.is_set() and os.path.exists(temp_audio):
+                    os.unlink(temp_audio)
+            
+            try:
+                if self.cancel_event.is_set():
+                    # Starting the server now would undo the Stop
+                    self.signals.error.emit(file_path, "Processing cancelled")
+                    return
+                
+                # Reuse the running server, only (re)loading the model if needed
+                self.server.start(model_name, compute_type)
+                self.server.submit(
+                    audio,
+                    str(output_file),
+                    include_timestamps,
+                    auto_clean,
+                    key
+                )
+                
+                # Monitor queues until the job finishes or the server is terminated
+                self.monitor_process(
+                    file_path,
+                    self.server.thread,
+                    self.server.progress_queue
+                )
+            finally:
+                self.server.lock.release()
+                if temp_audio is not None and os.path.exists(temp_audio):
+                    os.unlink(temp_audio)
             
         except Exception as e:
-            self.signals.log.emit(f"Error setting up process: {str(e)}")
+            self.signals.log.emit(
+                f"Error setting up process: {str(e)}\n{traceback.format_exc().rstrip()}"
+            )
             self.signals.error.emit(file_path, str(e))
-            traceback.print_exc()
+    
+    def _wait_for_model(self):
+        """
+        Take the server's lock, giving up if processing is cancelled while
+        another file is being transcribed.
+        
+        Returns:
+            bool: True if the lock is now held, False if cancelled
+        """
+        while not self.cancel_event.is_set():
+            if self.server.lock.acquire(timeout=0.5):
+                return True
+        return False
             
-    def monitor_process(self, file_path, process, result_queue, progress_queue):
+    def monitor_process(self, file_path, thread, progress_queue):
         """
-        Monitor the progress queue for updates from the transcription process.
+        Forward updates from the transcription thread until the job is done.
+        
+        Blocks on the queue, so updates are forwarded as soon as they
+        arrive instead of on the next polling tick. Whatever else is already
+        waiting (up to MAX_DRAIN updates) is taken at the same time, and its
+        log lines and progress values are coalesced into one signal each.
         
         Args:
             file_path: Path to the MP4 file being processed
-            process: The multiprocessing.Process object
-            result_queue: Queue for results
-            progress_queue: Queue for progress updates
+            thread: The server's threading.Thread
+            progress_queue: Queue for progress updates and the job result
+            
+        Returns once the job has completed or failed, the thread exits, or
+        processing was cancelled. An error is emitted for the file in the
+        last two cases, since the job never reports back.
         """
-        import time
-        
-        while process.is_alive():
-            # Check for progress updates
-            while not progress_queue.empty():
-                try:
-                    update = progress_queue.get_nowait()
-                    if update[0] == "progress":
-                        _, percent, message = update
-                        self.signals.progress.emit(file_path, percent, message)
-                    elif update[0] == "log":
-                        self.signals.log.emit(update[1])
-                    elif update[0] == "error":
-                        self.signals.error.emit(file_path, update[1])
-                except Exception as e:
-                    self.signals.log.emit(f"Error receiving update: {str(e)}")
+        while True:
+            try:
+                update = progress_queue.get(timeout=1.0)
+            except queue.Empty:
+                # Nothing for a while; stop if the thread died or was cancelled
+                if self.cancel_event.is_set():
+                    self.signals.error.emit(file_path, "Processing cancelled")
+                    return
+                if thread is None or not thread.is_alive():
+                    self.signals.error.emit(file_path, "Transcription server stopped unexpectedly")
+                    return
+                continue
+            except Exception as e:
+                self.signals.log.emit(f"Error receiving update: {str(e)}")
+                self.signals.error.emit(file_path, str(e))
+                return
             
-            # Check for results
-            if not result_queue.empty():
+            batch = [update]
+            while len(batch) < MAX_DRAIN:
                 try:
-                    result = result_queue.get_nowait()
-                    if result[0] == "completed":
-                        self.signals.completed.emit(file_path)
-                except Exception as e:
-                    self.signals.log.emit(f"Error receiving result: {str(e)}")
+                    batch.append(progress_queue.get_nowait())
+                except queue.Empty:
+                    break
             
-            # Small delay to prevent CPU spinning
-            time.sleep(0.1)
-        
-        # Process has ended, check if there are any remaining messages
-        try:
-            while not progress_queue.empty():
-                update = progress_queue.get_nowait()
+            logs = []
+            last_progress = None
+            for update in batch:
+                if update[0] == "log":
+                    logs.append(update[1])
+                    continue
                 if update[0] == "progress":
-                    _, percent, message = update
-                    self.signals.progress.emit(file_path, percent, message)
-                elif update[0] == "log":
-                    self.signals.log.emit(update[1])
+                    last_progress = update[1:]
+                    continue
+                if update[0] == "progress_log":
+                    logs.append(update[2])
+                    last_progress = update[1:]
+                    continue
+                
+                # Results are forwarded in order, after everything before them
+                self._flush_updates(file_path, logs, last_progress)
+                logs = []
+                last_progress = None
+                if update[0] == "__done__":
+                    return
                 elif update[0] == "error":
                     self.signals.error.emit(file_path, update[1])
-                    
-            while not result_queue.empty():
-                result = result_queue.get_nowait()
-                if result[0] == "completed":
+                elif update[0] == "completed":
                     self.signals.completed.emit(file_path)
-        except Exception as e:
-            self.signals.log.emit(f"Error processing remaining messages: {str(e)}")
+            self._flush_updates(file_path, logs, last_progress)
+    
+    def _flush_updates(self, file_path, logs, last_progress):
+        """
+        Emit coalesced log lines and the latest progress value, if any.
+        
+        Args:
+            file_path: Path to the MP4 file being processed
+            logs: Log messages to emit as one joined message
+            last_progress: (percent, message) of the newest progress update
+        """
+        if logs:
+            self.signals.log.emit('\n'.join(logs))
+        if last_progress is not None:
+            self.report_progress(file_path, *last_progress)
             
     def terminate(self):
         """
-        Terminate the current transcription process if it exists.
+        Cancel the running transcription and stop the server thread. The
+        model itself stays cached by load_model for the next start.
         """
-        if self.process and self.process.is_alive():
-            # Terminate without excessive logging
-            self.process.terminate()
-            self.process.join(timeout=1)  # Wait a bit for clean termination
-            
-            # If process is still alive, try more aggressive termination
-            if self.process.is_alive():
-                if hasattr(os, 'kill'):
-                    try:
-                        os.kill(self.process.pid, signal.SIGKILL)
-                    except Exception:
-                        pass
+        self.cancel_event.set()
+        self.server.terminate()
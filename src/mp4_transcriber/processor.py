@@ -4,14 +4,29 @@ Video processing pipeline for MP4 Transcriber.
 
 import os
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
+try:
+    import orjson  # Faster JSON, from the optional "speedups" extra
+except ImportError:
+    orjson = None
+
 from mp4_transcriber.audio import extract_audio
-from mp4_transcriber.transcription import transcribe_audio, create_transcript_with_timestamps
+from mp4_transcriber.transcription import (
+    DEFAULT_BACKEND,
+    load_model,
+    transcribe_audio,
+    create_transcript_with_timestamps,
+)
 from mp4_transcriber.text_processing import clean_transcript
 
 
-def process_video(video_path, output_path=None, model_size="base", with_timestamps=False, cleanup=True, verbose=False):
+def process_video(video_path, output_path=None, model_size="base", with_timestamps=False, cleanup=True, verbose=False,
+                  backend=DEFAULT_BACKEND, batch_size=None, processors=1, threads=0,
+                  compute_type=None, model=None, precision="fp32", audio_path=None,
+                  compile_model=False):
     """
     Process a video file to create a transcript.
     
@@ -22,6 +37,19 @@ def process_video(video_path, output_path=None, model_size="base", with_timestam
         with_timestamps (bool): Whether to include timestamps
         cleanup (bool): Whether to remove temporary files
         verbose (bool): Whether to show detailed output
+        backend (str): Transcription backend ('whisper' or 'faster-whisper'),
+            faster-whisper by default when it is installed
+        batch_size (int, optional): Chunks decoded per batch (faster-whisper only)
+        processors (int): Number of chunks of the file to transcribe concurrently
+        threads (int): CPU threads per transcription, 0 for the library default
+        compute_type (str, optional): Weight precision (faster-whisper only)
+        model (optional): Already loaded model to use instead of loading one
+        precision (str): CPU precision for OpenAI Whisper ('fp32' or 'bf16')
+        audio_path (str, optional): Audio already extracted from the video
+            by extract_audio, used instead of extracting it again. It is
+            cleaned up like a freshly extracted file.
+        compile_model (bool): Compile the model with torch.compile
+            (whisper backend only, experimental)
         
     Returns:
         str: Path to the created transcript, or None if processing failed
@@ -32,64 +60,308 @@ def process_video(video_path, output_path=None, model_size="base", with_timestam
         output_path = f"{base_path}_transcript.txt"
     
     # Extract audio from video
-    audio_path = extract_audio(video_path, verbose=verbose)
+    if audio_path is None:
+        audio_path = extract_audio(video_path, verbose=verbose)
     if not audio_path:
         return None
     
     try:
         # Transcribe the audio
-        result = transcribe_audio(audio_path, model_size, verbose)
+        if model is None:
+            model = load_model(
+                model_size,
+                verbose,
+                backend,
+                threads=threads,
+                num_workers=processors,
+                compute_type=compute_type,
+                compile_model=compile_model
+            )
+        result = transcribe_audio(
+            audio_path,
+            model_size,
+            verbose,
+            model=model,
+            batch_size=batch_size,
+            processors=processors,
+            precision=precision
+        )
         
-        # Format the transcript
+        # Format the transcript straight into a temporary file with a large
+        # buffer, then publish it atomically so a crash or cancel never
+        # leaves a truncated transcript behind
+        tmp_path = f"{output_path}.tmp"
         try:
-            if with_timestamps:
-                transcript = create_transcript_with_timestamps(result['segments'])
-            else:
-                transcript = clean_transcript(result)
-        except Exception as e:
-            print(f"Warning: Error during transcript formatting: {e}")
-            # Fallback to raw text in case of formatting error
-            transcript = result.get('text', '')
-            print("Using raw transcript text without formatting.")
-                
-            # Add a basic cleanup even if text processing failed
-            transcript = transcript.strip()
-            if transcript and transcript[0].islower():
-                transcript = transcript[0].upper() + transcript[1:]
-        
-        # Write the transcript to the output file
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(transcript)
+            with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                try:
+                    if with_timestamps:
+                        # Written line by line as each segment is formatted
+                        create_transcript_with_timestamps(result['segments'], f)
+                    else:
+                        f.write(clean_transcript(result))
+                except Exception as e:
+                    print(f"Warning: Error during transcript formatting: {e}")
+                    # Fallback to raw text in case of formatting error
+                    transcript = result.get('text', '')
+                    print("Using raw transcript text without formatting.")
+                    
+                    # Add a basic cleanup even if text processing failed
+                    transcript = transcript.strip()
+                    
+                    # Replace anything written before the error
+                    f.seek(0)
+                    f.truncate()
+                    f.write(transcript)
+            os.replace(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
         
         print(f"Transcript saved to {output_path}")
         
         # Optionally save the raw JSON result
         if verbose:
             json_path = f"{os.path.splitext(output_path)[0]}_raw.json"
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            with open(json_path, 'wb') as f:
+                if orjson:
+                    f.write(orjson.dumps(
+                        result,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                    ))
+                else:
+                    f.write(json.dumps(result, indent=2).encode('utf-8'))
             print(f"Raw transcription data saved to {json_path}")
         
         return output_path
     
     finally:
-        # Clean up temporary audio file
-        if cleanup and audio_path and os.path.exists(audio_path):
+        # Clean up temporary audio file, never the input itself
+        if (
+            cleanup
+            and audio_path
+            and audio_path != video_path
+            and os.path.exists(audio_path)
+        ):
             os.unlink(audio_path)
             if verbose:
                 print(f"Cleaned up temporary audio file: {audio_path}")
 
 
-def batch_process(directory, output_dir=None, model_size="base", with_timestamps=False, verbose=False):
+# Files picked up by batch mode; audio files skip video demuxing and may
+# be passed to Whisper as they are
+MEDIA_EXTENSIONS = ('.mp4', '.mp3', '.m4a')
+
+
+def iter_media_files(directory, extensions=MEDIA_EXTENSIONS):
+    """
+    Yield the files in a directory with one of the given extensions as they are listed.
+    
+    Entries come straight from os.scandir, so callers can start on the
+    first file before a large or slow (e.g. network) directory has been
+    listed completely. Extensions are matched case-insensitively, so
+    ``.MP4`` files from cameras are included.
+    
+    Args:
+        directory (str): Directory to scan
+        extensions (tuple): File extensions to match
+        
+    Yields:
+        Path: Path of each matching file
+    """
+    extensions = tuple(extension.lower() for extension in extensions)
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.lower().endswith(extensions) and entry.is_file():
+                yield Path(entry.path)
+
+
+def _batch_jobs(media_files, out_path):
+    """
+    Pair each media file with the transcript path it is written to.
+    
+    Transcripts are named after the file's stem, so ``talk.mp4`` and
+    ``talk.mp3`` would share one. The first file seen keeps the plain name;
+    later files with the same stem get their extension added, e.g.
+    ``talk_mp3_transcript.txt``. Stems are compared case-insensitively for
+    filesystems that ignore case.
+    
+    Args:
+        media_files (iterable): Paths of the files to transcribe
+        out_path (Path): Directory the transcripts go to
+        
+    Yields:
+        tuple: (media file, transcript file) paths
+    """
+    seen = set()
+    for media_file in media_files:
+        name = media_file.stem
+        if name.lower() in seen:
+            name = f"{name}_{media_file.suffix.lstrip('.').lower()}"
+            print(f"Warning: {media_file.name} shares its name with another file, "
+                  f"writing {name}_transcript.txt")
+        seen.add(name.lower())
+        yield media_file, out_path / f"{name}_transcript.txt"
+
+
+# Model loaded once per batch worker process by _init_batch_worker
+_WORKER_MODEL = None
+
+
+def _init_batch_worker(model_size, verbose, backend, threads, processors, compute_type,
+                       compile_model=False):
+    """
+    Load the model a batch worker uses for all of its files.
+    
+    Args:
+        model_size (str): Whisper model size
+        verbose (bool): Whether to show detailed output
+        backend (str): Transcription backend
+        threads (int): CPU threads for this worker, 0 for the library default
+        processors (int): Number of chunks of each file to transcribe concurrently
+        compute_type (str, optional): Weight precision (faster-whisper only)
+        compile_model (bool): Compile the model with torch.compile
+    """
+    global _WORKER_MODEL
+    if threads:
+        # Must be set before torch is first imported by load_model
+        os.environ['OMP_NUM_THREADS'] = str(threads)
+    _WORKER_MODEL = load_model(
+        model_size,
+        verbose,
+        backend,
+        threads=threads,
+        num_workers=processors,
+        compute_type=compute_type,
+        compile_model=compile_model
+    )
+
+
+def _transcribe_batch_file(paths, options, audio_path=None):
+    """
+    Transcribe one file of a batch with the worker's model.
+    
+    Defined at module level so it can be sent to worker processes.
+    
+    Args:
+        paths (tuple): (video file, transcript file) paths
+        options (dict): Keyword arguments for process_video
+        audio_path (str, optional): Audio already extracted from the video
+        
+    Returns:
+        str: Path to the transcript, as returned by process_video
+    """
+    video_file, output_file = paths
+    print(f"Processing {video_file}...")
+    return process_video(
+        str(video_file),
+        str(output_file),
+        model=_WORKER_MODEL,
+        audio_path=audio_path,
+        **options
+    )
+
+
+def _transcribe_prefetched(jobs, options):
+    """
+    Transcribe batch jobs one at a time, extracting the next file's audio
+    in a background thread while the current file is transcribed.
+    
+    Only one extraction runs ahead, so at most two temporary audio files
+    exist at a time. If a transcription fails, the extraction running
+    ahead is cancelled or its audio deleted before the error propagates.
+    
+    Args:
+        jobs (iterable): (video file, transcript file) paths
+        options (dict): Keyword arguments for process_video
+        
+    Returns:
+        int: Number of files processed
+    """
+    count = 0
+    pending = None
+    with ThreadPoolExecutor(max_workers=1) as extractor:
+        try:
+            for paths in jobs:
+                extraction = extractor.submit(extract_audio, str(paths[0]), verbose=options['verbose'])
+                current, pending = pending, (paths, extraction)
+                if current is not None:
+                    count += _transcribe_pending(*current, options)
+            current, pending = pending, None
+            if current is not None:
+                count += _transcribe_pending(*current, options)
+        finally:
+            if pending is not None:
+                _discard_pending(*pending)
+    return count
+
+
+def _discard_pending(paths, extraction):
     """
-    Process all MP4 files in a directory.
+    Cancel an extraction that will not be transcribed, or delete its audio
+    if it already started.
     
     Args:
-        directory (str): Directory containing MP4 files
+        paths (tuple): (video file, transcript file) paths
+        extraction (Future): Result of extract_audio for the video
+    """
+    if extraction.cancel() or extraction.exception() is not None:
+        return
+    audio_path = extraction.result()
+    if audio_path and audio_path != str(paths[0]) and os.path.exists(audio_path):
+        os.unlink(audio_path)
+
+
+def _transcribe_pending(paths, extraction, options):
+    """
+    Transcribe a job once its audio extraction has finished.
+    
+    Args:
+        paths (tuple): (video file, transcript file) paths
+        extraction (Future): Result of extract_audio for the video
+        options (dict): Keyword arguments for process_video
+        
+    Returns:
+        int: 1, counting the file whether or not it succeeded
+    """
+    audio_path = extraction.result()
+    if audio_path:
+        _transcribe_batch_file(paths, options, audio_path)
+    else:
+        print(f"Skipping {paths[0]}: audio extraction failed")
+    return 1
+
+
+def batch_process(directory, output_dir=None, model_size="base", with_timestamps=False, verbose=False,
+                  backend=DEFAULT_BACKEND, batch_size=None, processors=1, threads=0,
+                  compute_type=None, workers=1, precision="fp32", compile_model=False):
+    """
+    Process all media files (MP4, MP3, M4A) in a directory.
+    
+    Files are handed out as the directory is scanned. The model is loaded
+    once and reused for every file. With more than one worker the files
+    are transcribed in separate processes, each loading its own copy of
+    the model and limited to its share of the CPU threads; several small
+    single-threaded workers usually beat one process using every core.
+    With a single worker the audio of the next file is extracted while
+    the current one is transcribed.
+    
+    Args:
+        directory (str): Directory containing media files
         output_dir (str, optional): Directory to save transcripts
         model_size (str): Whisper model size
         with_timestamps (bool): Whether to include timestamps
         verbose (bool): Whether to show detailed output
+        backend (str): Transcription backend ('whisper' or 'faster-whisper'),
+            faster-whisper by default when it is installed
+        batch_size (int, optional): Chunks decoded per batch (faster-whisper only)
+        processors (int): Number of chunks of each file to transcribe concurrently
+        threads (int): CPU threads per transcription, 0 for the library default
+        compute_type (str, optional): Weight precision (faster-whisper only)
+        workers (int): Number of files to transcribe at the same time, 0 to
+            use one worker per `threads` cores (2 if threads is 0)
+        precision (str): CPU precision for OpenAI Whisper ('fp32' or 'bf16')
+        compile_model (bool): Compile the model with torch.compile
+            (whisper backend only, experimental)
     """
     dir_path = Path(directory)
     if output_dir:
@@ -98,16 +370,40 @@ def batch_process(directory, output_dir=None, model_size="base", with_timestamps
     else:
         out_path = dir_path
     
-    mp4_files = list(dir_path.glob('*.mp4'))
-    print(f"Found {len(mp4_files)} MP4 files in {directory}")
-    
-    for video_file in mp4_files:
-        output_file = out_path / f"{video_file.stem}_transcript.txt"
-        print(f"Processing {video_file}...")
-        process_video(
-            str(video_file), 
-            str(output_file), 
-            model_size=model_size, 
-            with_timestamps=with_timestamps,
-            verbose=verbose
+    options = dict(
+        model_size=model_size,
+        with_timestamps=with_timestamps,
+        verbose=verbose,
+        backend=backend,
+        batch_size=batch_size,
+        processors=processors,
+        threads=threads,
+        compute_type=compute_type,
+        precision=precision
+    )
+    jobs = _batch_jobs(iter_media_files(dir_path), out_path)
+    
+    cpu_count = os.cpu_count() or 1
+    if workers == 0:
+        workers = max(1, cpu_count // (threads or 2))
+    
+    if workers > 1:
+        # Split the cores between the workers instead of oversubscribing them
+        worker_threads = threads or max(1, cpu_count // workers)
+        transcribe = partial(_transcribe_batch_file, options=options)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_batch_worker,
+            initargs=(
+                model_size, verbose, backend, worker_threads, processors, compute_type,
+                compile_model
+            )
+        ) as executor:
+            count = sum(1 for _ in executor.map(transcribe, jobs, chunksize=1))
+    else:
+        _init_batch_worker(
+            model_size, verbose, backend, threads, processors, compute_type, compile_model
         )
+        count = _transcribe_prefetched(jobs, options)
+    
+    print(f"Processed {count} media files in {directory}")
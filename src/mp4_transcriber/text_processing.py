@@ -3,18 +3,48 @@ Text processing utilities for cleaning up transcription output.
 """
 
 import re
-import nltk
-from nltk.tokenize import sent_tokenize as nltk_sent_tokenize
 
-# Define our own sent_tokenize that handles missing resources gracefully
+# Whitespace that follows sentence-ending punctuation
+_SENTENCE_BREAK = re.compile(r'(?<=[.!?])\s+')
+
+# Cleanup applied in a single scan: unintelligible markers (with the
+# whitespace before them), hyphenated words split across a space, and runs
+# of whitespace. The marker alternative comes first so it also claims the
+# whitespace in front of it.
+_CLEAN_RE = re.compile(r'\s*\(\s*[Uu]nintelligible\s*\)|(\w)-\s+(\w)|(\s+)')
+
+# Words ending in a period that do not end a sentence
+ABBREVIATIONS = frozenset({
+    'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'sr.', 'jr.', 'st.',
+    'vs.', 'etc.', 'inc.', 'ltd.', 'co.', 'e.g.', 'i.e.',
+})
+
+
+def _clean_sub(match):
+    """Replacement for a _CLEAN_RE match, depending on which alternative matched."""
+    if match.group(3):
+        return ' '                                   # Remove extra whitespace
+    if match.group(1):
+        return match.group(1) + match.group(2)       # Join hyphenated words
+    return ''                                        # Remove unintelligible markers
+
+
 def sent_tokenize(text):
-    """Tokenize text into sentences, with fallback for missing resources."""
-    try:
-        return nltk_sent_tokenize(text)
-    except LookupError as e:
-        print(f"Warning: NLTK tokenization failed, using simple fallback: {e}")
-        # Simple period-based sentence splitting as fallback
-        return [s.strip() for s in text.split('.') if s.strip()]
+    """Yield the sentences of text, split on '.', '!' and '?' but not after abbreviations."""
+    sentence = None
+    for part in _SENTENCE_BREAK.split(text.strip()):
+        if not part:
+            continue
+        if sentence is None:
+            sentence = part
+        elif sentence.rsplit(None, 1)[-1].lower() in ABBREVIATIONS:
+            # Re-attach text that was split off after an abbreviation
+            sentence = f"{sentence} {part}"
+        else:
+            yield sentence
+            sentence = part
+    if sentence is not None:
+        yield sentence
 
 
 def clean_transcript(transcript_data):
@@ -32,19 +62,12 @@ def clean_transcript(transcript_data):
         text = transcript_data.get('text', '')
     else:
         text = transcript_data
+    if not text:
+        return ''
     
     # Basic cleanup
-    text = re.sub(r'\s+', ' ', text)                 # Remove extra whitespace
-    text = re.sub(r'(\w)- (\w)', r'\1\2', text)      # Join hyphenated words
-    text = re.sub(r'\(\s*[Uu]nintelligible\s*\)', '', text)  # Remove unintelligible markers
-    
-    # Ensure proper sentence boundaries
-    sentences = sent_tokenize(text)
-    
-    # Capitalize first letter of each sentence
-    sentences = [s[0].upper() + s[1:] if s and len(s) > 0 else s for s in sentences]
-    
-    # Join sentences with proper spacing
-    cleaned_text = ' '.join(sentences)
+    text = _CLEAN_RE.sub(_clean_sub, text)
     
-    return cleaned_text
+    # Capitalize the first letter of each sentence and join them with
+    # proper spacing, without building an intermediate list
+    return ' '.join(s[:1].upper() + s[1:] for s in sent_tokenize(text))
@@ -2,10 +2,61 @@
 Speech-to-text transcription functionality for MP4 Transcriber.
 """
 
+import os
+import threading
 import time
-from datetime import timedelta
-import torch
-import whisper
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import numpy as np
+
+from mp4_transcriber.audio import SAMPLE_RATE, extract_audio_to_array
+from mp4_transcriber.cache import CACHE_DIR
+from mp4_transcriber.cpu import has_cpu_flag
+
+try:
+    from faster_whisper import WhisperModel, BatchedInferencePipeline
+except ImportError:
+    WhisperModel = None
+    BatchedInferencePipeline = None
+
+# Transcription backends that load_model can use
+BACKENDS = ("whisper", "faster-whisper")
+
+# The CTranslate2 backend is several times faster, so it is used whenever
+# it is installed
+DEFAULT_BACKEND = "faster-whisper" if WhisperModel is not None else "whisper"
+
+# Weight precisions supported by the faster-whisper backend
+COMPUTE_TYPES = ("int8", "int8_float16", "float16", "float32")
+
+# Precision used on GPUs when none is requested; CPUs use int8
+DEFAULT_COMPUTE_TYPE = "int8_float16"
+
+# Compute precisions for the OpenAI Whisper backend on CPU
+PRECISIONS = ("fp32", "bf16")
+
+# Where faster-whisper stores the downloaded CTranslate2 models
+CT2_MODEL_DIR = CACHE_DIR / "ct2"
+
+# Where OpenAI Whisper stores its checkpoints (same default as whisper itself)
+WHISPER_MODEL_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")), "whisper"
+)
+
+# Number of 30-second chunks decoded together by the batched pipeline
+DEFAULT_BATCH_SIZE = 16
+
+# Seconds of audio shared by neighbouring chunks in transcribe_parallel
+CHUNK_OVERLAP = 1.0
+
+# Number of loaded models load_model keeps for reuse; small so switching
+# to a large model does not keep several others in (V)RAM
+MODEL_CACHE_SIZE = 2
+
+# Loaded models keyed by their load_model settings, least recently used first
+_MODEL_CACHE = OrderedDict()
+_MODEL_CACHE_LOCK = threading.Lock()
 
 
 def format_timestamp(seconds):
@@ -18,40 +69,473 @@ def format_timestamp(seconds):
     Returns:
         str: Formatted time string
     """
-    return str(timedelta(seconds=seconds)).split('.')[0]
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class TranscriptionCancelled(Exception):
+    """Raised when a transcription is stopped through its cancel event."""
+
+
+def _check_cancelled(cancel_event):
+    """Raise TranscriptionCancelled if the cancel event is set."""
+    if cancel_event is not None and cancel_event.is_set():
+        raise TranscriptionCancelled("Transcription cancelled")
 
 
-def transcribe_audio(audio_path, model_size="base", verbose=False):
+@contextmanager
+def _cancellable_decode(model, cancel_event):
     """
-    Transcribe audio using Whisper.
+    Check the cancel event before each 30-second window an OpenAI Whisper
+    model decodes.
+    
+    whisper.transcribe calls ``model.decode`` once per window, so the
+    method is shadowed on the instance for the duration of the block and
+    restored afterwards.
+    
+    Args:
+        model (whisper.model.Whisper): The loaded model
+        cancel_event (threading.Event, optional): Event to check, nothing
+            is wrapped if None
+    """
+    if cancel_event is None:
+        yield
+        return
+    
+    decode = model.decode
+    
+    def checked_decode(*args, **kwargs):
+        _check_cancelled(cancel_event)
+        return decode(*args, **kwargs)
+    
+    model.decode = checked_decode
+    try:
+        yield
+    finally:
+        del model.decode
+
+
+@contextmanager
+def _bf16_encoder(model):
+    """
+    Run an OpenAI Whisper model's audio encoder under bfloat16 autocast.
+    
+    Only the encoder is autocast, and its output is cast back to float32:
+    with ``fp16=False`` Whisper's decoding rejects audio features that are
+    not float32. The encoder's ``forward`` is shadowed on the instance for
+    the duration of the block and restored afterwards.
+    
+    Args:
+        model (whisper.model.Whisper): The loaded model
+    """
+    import torch
+    
+    encoder = model.encoder
+    forward = encoder.forward
+    
+    def bf16_forward(*args, **kwargs):
+        with torch.autocast("cpu", dtype=torch.bfloat16):
+            return forward(*args, **kwargs).float()
+    
+    encoder.forward = bf16_forward
+    try:
+        yield
+    finally:
+        del encoder.forward
+
+
+def faster_whisper_available():
+    """
+    Check if the optional faster-whisper backend is installed.
+    
+    Returns:
+        bool: True if faster-whisper can be used, False otherwise
+    """
+    return WhisperModel is not None
+
+
+def load_model(model_size="base", verbose=False, backend=DEFAULT_BACKEND, threads=0, num_workers=1,
+               compute_type=None, compile_model=False):
+    """
+    Load a Whisper model onto the best available device.
+    
+    The MODEL_CACHE_SIZE most recently used models are kept, so asking
+    again for a model with the same settings returns it without loading.
     
     Args:
-        audio_path (str): Path to the audio file
         model_size (str): Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
         verbose (bool): Whether to show detailed output
+        backend (str): 'whisper' for OpenAI Whisper or 'faster-whisper'
+            for the CTranslate2 implementation (the default when installed)
+        threads (int): CPU threads used per inference, 0 to choose automatically
+        num_workers (int): Number of transcriptions the model may run
+            concurrently (faster-whisper only)
+        compute_type (str, optional): Weight precision from COMPUTE_TYPES
+            (faster-whisper only). Defaults to int8_float16 on GPU and int8
+            on CPU; float16 variants fall back to their CPU equivalent.
+        compile_model (bool): Compile the encoder and decoder with
+            torch.compile (OpenAI Whisper only, experimental)
         
     Returns:
-        dict: Transcription results from Whisper
+        The loaded model (whisper.model.Whisper or faster_whisper.WhisperModel)
     """
-    print(f"Loading Whisper model '{model_size}'...")
+    key = (model_size, backend, threads, num_workers, compute_type, compile_model)
+    with _MODEL_CACHE_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            _MODEL_CACHE.move_to_end(key)
+            return model
+    
+    model = _load_model(model_size, verbose, backend, threads, num_workers, compute_type)
+    if compile_model and not _is_faster_whisper(model):
+        _compile_model(model, verbose)
+    
+    with _MODEL_CACHE_LOCK:
+        _MODEL_CACHE[key] = model
+        _MODEL_CACHE.move_to_end(key)
+        while len(_MODEL_CACHE) > MODEL_CACHE_SIZE:
+            _MODEL_CACHE.popitem(last=False)
+    return model
+
+
+def _load_model(model_size, verbose, backend, threads, num_workers, compute_type):
+    """
+    Load a model without consulting the cache (see load_model).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == "faster-whisper" and not faster_whisper_available():
+        raise ImportError("faster-whisper is not installed. Install it with: pip install faster-whisper")
+    
+    print(f"Loading Whisper model '{model_size}' ({backend})...")
+    
+    # Imported here so processes forked before the first load do not
+    # inherit a half-initialized torch/CUDA state
+    import torch
     
     # Check if CUDA is available
     device = "cuda" if torch.cuda.is_available() else "cpu"
     if verbose:
         print(f"Using device: {device}")
     
-    # Load the Whisper model
-    model = whisper.load_model(model_size, device=device)
+    if backend == "faster-whisper":
+        if compute_type is None:
+            compute_type = DEFAULT_COMPUTE_TYPE if device == "cuda" else "int8"
+        elif device == "cpu":
+            # CPUs have no float16 kernels, use the closest supported type
+            compute_type = {"int8_float16": "int8", "float16": "float32"}.get(compute_type, compute_type)
+        if verbose:
+            print(f"Using compute type: {compute_type}")
+        
+        # Split the cores between the workers instead of oversubscribing them
+        cpu_threads = threads or max(1, (os.cpu_count() or 1) // num_workers)
+        options = dict(
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers,
+            download_root=str(CT2_MODEL_DIR)
+        )
+        # Installed with faster-whisper, which downloads through it
+        from huggingface_hub.utils import LocalEntryNotFoundError
+        
+        try:
+            # Load from disk without asking the Hugging Face Hub for updates
+            return WhisperModel(model_size, local_files_only=True, **options)
+        except LocalEntryNotFoundError:
+            # Not downloaded yet; any other error is a real loading failure
+            return WhisperModel(model_size, **options)
+    
+    import whisper
+    
+    if threads:
+        torch.set_num_threads(threads)
+    return whisper.load_model(model_size, device=device, download_root=WHISPER_MODEL_DIR)
+
+
+def _compile_model(model, verbose=False):
+    """
+    Compile an OpenAI Whisper model's encoder and decoder in place.
+    
+    Whisper runs the same decoder step over and over with fixed shapes, so
+    on GPUs "reduce-overhead" captures it in CUDA graphs; on CPU
+    "max-autotune" fuses the elementwise operations. Compilation happens
+    lazily on the first call; any failure leaves the model uncompiled.
+    
+    Args:
+        model (whisper.model.Whisper): The loaded model
+        verbose (bool): Whether to show detailed output
+    """
+    import torch
+    
+    if not hasattr(torch, "compile"):
+        print("Warning: torch.compile needs PyTorch 2.0 or later, running uncompiled")
+        return
+    
+    mode = "reduce-overhead" if model.device.type == "cuda" else "max-autotune"
+    try:
+        encoder = torch.compile(model.encoder, mode=mode)
+        decoder = torch.compile(model.decoder, mode=mode)
+    except Exception as e:
+        print(f"Warning: Could not compile model, running uncompiled: {e}")
+        return
+    model.encoder = encoder
+    model.decoder = decoder
+    if verbose:
+        print(f"Compiled model with torch.compile (mode={mode})")
+
+
+def warmup_model(model):
+    """
+    Run a model on the GPU once over 30 seconds of silence.
+    
+    The first inference on a GPU pays one-off costs such as CUDA context and
+    kernel setup. Doing it right after loading keeps that off the first real
+    file. CPU models have no such costs, so they are left alone rather than
+    spending seconds decoding silence.
+    
+    Args:
+        model: Model returned by load_model
+    """
+    if _is_faster_whisper(model):
+        if model.model.device != "cuda":
+            return
+        segments, _ = model.transcribe(np.zeros(SAMPLE_RATE * 30, dtype=np.float32))
+        list(segments)
+    elif model.device.type == "cuda":
+        model.transcribe(np.zeros(SAMPLE_RATE * 30, dtype=np.float32), fp16=True, verbose=None)
+
+
+def _transcribe_faster_whisper(model, audio, verbose=False, batch_size=None, cancel_event=None):
+    """
+    Transcribe with a faster-whisper model and return Whisper's result layout.
+    
+    Args:
+        model (faster_whisper.WhisperModel): The loaded model
+        audio (str or numpy.ndarray): Path to the audio file or samples
+        verbose (bool): Whether to print segments as they are decoded
+        batch_size (int, optional): Decode this many 30-second chunks at once
+            using BatchedInferencePipeline
+        cancel_event (threading.Event, optional): Checked between segments;
+            once set, TranscriptionCancelled is raised
+        
+    Returns:
+        dict: Result with 'text', 'segments' and 'language' keys
+    """
+    if batch_size and batch_size > 1:
+        pipeline = BatchedInferencePipeline(model=model)
+        segment_iter, info = pipeline.transcribe(audio, batch_size=batch_size)
+    else:
+        segment_iter, info = model.transcribe(audio)
+    
+    # Segments are decoded lazily as the generator is consumed
+    segments = []
+    for segment in segment_iter:
+        _check_cancelled(cancel_event)
+        if verbose:
+            print(f"[{format_timestamp(segment.start)} --> {format_timestamp(segment.end)}] {segment.text.strip()}")
+        segments.append({
+            'id': segment.id,
+            'start': segment.start,
+            'end': segment.end,
+            'text': segment.text,
+        })
+    
+    return {
+        'text': ''.join(segment['text'] for segment in segments),
+        'segments': segments,
+        'language': info.language,
+    }
+
+
+def _is_faster_whisper(model):
+    """Check if a loaded model comes from the faster-whisper backend."""
+    return WhisperModel is not None and isinstance(model, WhisperModel)
+
+
+def _run_model(model, audio, verbose=False, batch_size=None, cancel_event=None,
+               precision="fp32"):
+    """
+    Run a loaded model of either backend over the given audio.
+    
+    Args:
+        model: Model returned by load_model
+        audio (str or numpy.ndarray): Path to the audio file or samples
+        verbose (bool): Whether to show detailed output
+        batch_size (int, optional): Chunks decoded per batch (faster-whisper only)
+        cancel_event (threading.Event, optional): Stops the transcription
+            when set, checked between segments (faster-whisper) or
+            30-second windows (OpenAI Whisper)
+        precision (str): 'bf16' runs OpenAI Whisper's encoder on CPU under
+            bfloat16 autocast when the CPU supports it natively, 'fp32'
+            keeps full precision. faster-whisper uses its compute_type
+            instead.
+        
+    Returns:
+        dict: Transcription results in Whisper's layout
+    """
+    _check_cancelled(cancel_event)
+    if _is_faster_whisper(model):
+        return _transcribe_faster_whisper(model, audio, verbose, batch_size, cancel_event)
+    
+    on_cpu = model.device.type == "cpu"
+    if precision == "bf16" and on_cpu and has_cpu_flag('avx512_bf16', 'amx_bf16'):
+        import torch
+        
+        # Weights stay float32; the encoder's matmuls and convolutions run
+        # in bfloat16 and the decoder gets float32 features back. fp16=False
+        # keeps Whisper from casting the input to float16 itself. The matmul
+        # precision is process-wide, so it is restored afterwards to keep
+        # later fp32 work at full precision.
+        matmul_precision = torch.get_float32_matmul_precision()
+        torch.set_float32_matmul_precision("medium")
+        try:
+            with _bf16_encoder(model), _cancellable_decode(model, cancel_event):
+                return model.transcribe(audio, fp16=False, verbose=verbose)
+        finally:
+            torch.set_float32_matmul_precision(matmul_precision)
+    
+    with _cancellable_decode(model, cancel_event):
+        return model.transcribe(
+            audio, 
+            fp16=not on_cpu,
+            verbose=verbose
+        )
+
+
+def transcribe_parallel(audio, model, processors=2, verbose=False, batch_size=None,
+                        cancel_event=None, precision="fp32"):
+    """
+    Transcribe one long recording as several chunks that run concurrently.
+    
+    The samples are split into ``processors`` contiguous chunks, and each
+    chunk also reads CHUNK_OVERLAP seconds of its neighbours on both sides.
+    Segment timestamps are shifted back to the position of their chunk, and
+    a segment is kept by the chunk whose own range contains its midpoint.
+    A sentence that straddles a boundary is therefore kept once, by
+    whichever chunk heard most of it, instead of being dropped by both.
+    Segments that mostly repeat speech the previous chunk already kept
+    (their midpoint lies before its last kept end) are dropped, and the
+    next one starts no earlier than that end, so timestamps never go back.
+    
+    Chunks only run at the same time with the faster-whisper backend, where
+    the model is safe to share between threads (load it with
+    ``num_workers=processors``). OpenAI Whisper installs per-call hooks on
+    the shared model, so its chunks are decoded one after another, which
+    is why transcribe_audio does not split files for that backend.
+    
+    Args:
+        audio (numpy.ndarray): 16 kHz mono float32 samples
+        model: Model returned by load_model
+        processors (int): Number of chunks to split the audio into
+        verbose (bool): Whether to show detailed output
+        batch_size (int, optional): Chunks decoded per batch (faster-whisper only)
+        cancel_event (threading.Event, optional): Stops the transcription
+            when set, checked before each chunk
+        precision (str): CPU precision for OpenAI Whisper ('fp32' or 'bf16')
+        
+    Returns:
+        dict: Transcription results with timestamps relative to the full audio
+    """
+    chunk_len = -(-len(audio) // processors)  # Ceiling division
+    overlap = int(CHUNK_OVERLAP * SAMPLE_RATE)
+    
+    # (first sample read, first sample owned, end of owned samples, end of
+    # samples read) for each chunk
+    bounds = []
+    for i in range(processors):
+        start = i * chunk_len
+        end = min(len(audio), start + chunk_len)
+        if start >= end:
+            break
+        bounds.append((max(0, start - overlap), start, end, min(len(audio), end + overlap)))
+    
+    def run_chunk(bound):
+        begin, _, _, read_end = bound
+        return _run_model(model, audio[begin:read_end], verbose, batch_size, cancel_event, precision)
+    
+    workers = len(bounds) if _is_faster_whisper(model) else 1
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        results = list(executor.map(run_chunk, bounds))
+    
+    segments = []
+    cutoff = float('-inf')  # End of the last kept segment
+    for i, ((begin, start, end, _), result) in enumerate(zip(bounds, results)):
+        offset = begin / SAMPLE_RATE
+        # The first and last chunks also own anything before or after them
+        owned_from = start / SAMPLE_RATE if i > 0 else float('-inf')
+        owned_to = end / SAMPLE_RATE if i < len(bounds) - 1 else float('inf')
+        for segment in result['segments']:
+            segment_start = segment['start'] + offset
+            midpoint = segment_start + (segment['end'] - segment['start']) / 2
+            if not owned_from <= midpoint < owned_to or midpoint < cutoff:
+                continue
+            segment = dict(segment)
+            segment['id'] = len(segments)
+            segment['start'] = max(segment_start, cutoff)
+            segment['end'] = max(segment['end'] + offset, segment['start'])
+            cutoff = segment['end']
+            segments.append(segment)
+    
+    return {
+        'text': ''.join(segment['text'] for segment in segments),
+        'segments': segments,
+        'language': results[0].get('language') if results else None,
+    }
+
+
+def transcribe_audio(audio_path, model_size="base", verbose=False, model=None, batch_size=None,
+                     processors=1, cancel_event=None, precision="fp32"):
+    """
+    Transcribe audio using Whisper.
+    
+    Args:
+        audio_path (str or numpy.ndarray): Path to the audio file, or 16 kHz
+            mono float32 samples
+        model_size (str): Whisper model size ('tiny', 'base', 'small', 'medium', 'large')
+        verbose (bool): Whether to show detailed output
+        model (optional): Already loaded model (see load_model) to use
+            instead of loading ``model_size``
+        batch_size (int, optional): Number of 30-second chunks to decode in
+            parallel. Only used with the faster-whisper backend.
+        processors (int): Split the audio into this many chunks and
+            transcribe them concurrently (see transcribe_parallel). Ignored
+            with a warning for the OpenAI Whisper backend.
+        cancel_event (threading.Event, optional): Set from another thread
+            to stop the transcription with TranscriptionCancelled
+        precision (str): 'bf16' to run OpenAI Whisper in bfloat16 on CPUs
+            that support it, 'fp32' for full precision
+        
+    Returns:
+        dict: Transcription results from Whisper
+    """
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+    if model is None:
+        model = load_model(model_size, verbose)
+    
+    if processors > 1 and not _is_faster_whisper(model):
+        # Chunks would run one after another, adding boundaries for no gain
+        print("Warning: --processors only speeds up the faster-whisper backend, "
+              "transcribing the whole file at once")
+        processors = 1
     
     print("Transcribing audio...")
     start_time = time.time()
     
     # Transcribe the audio file
-    result = model.transcribe(
-        audio_path, 
-        fp16=(device == "cuda"),
-        verbose=verbose
-    )
+    if processors > 1:
+        audio = audio_path
+        if isinstance(audio, str):
+            audio = extract_audio_to_array(audio)
+            if audio is None:
+                raise RuntimeError(f"Could not decode audio from {audio_path}")
+        result = transcribe_parallel(
+            audio, model, processors, verbose, batch_size, cancel_event, precision
+        )
+    else:
+        result = _run_model(model, audio_path, verbose, batch_size, cancel_event, precision)
     
     elapsed = time.time() - start_time
     print(f"Transcription completed in {elapsed:.2f} seconds")
@@ -59,21 +543,30 @@ def transcribe_audio(audio_path, model_size="base", verbose=False):
     return result
 
 
-def create_transcript_with_timestamps(segments):
+def create_transcript_with_timestamps(segments, out_file=None):
     """
     Create transcript with timestamps from segments.
     
     Args:
-        segments (list): List of segment dictionaries from Whisper
+        segments (iterable): Segment dictionaries from Whisper
+        out_file (file, optional): Text file to write each line to as it is
+            formatted, instead of building the whole transcript in memory
         
     Returns:
-        str: Formatted transcript with timestamps
+        str: Formatted transcript with timestamps, or None if written to
+            ``out_file``
     """
-    lines = []
-    for segment in segments:
-        start_time = format_timestamp(segment['start'])
-        end_time = format_timestamp(segment['end'])
-        text = segment['text'].strip()
-        lines.append(f"[{start_time} - {end_time}] {text}")
+    lines = (
+        f"[{format_timestamp(segment['start'])} - {format_timestamp(segment['end'])}] "
+        f"{segment['text'].strip()}"
+        for segment in segments
+    )
+    if out_file is None:
+        return '\n'.join(lines)
     
-    return '\n'.join(lines)
+    separator = ''
+    for line in lines:
+        out_file.write(separator)
+        out_file.write(line)
+        separator = '\n'
+    return None
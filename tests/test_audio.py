@@ -3,21 +3,27 @@ Tests for the audio module.
 """
 
 import os
+import sys
 import tempfile
+import threading
+import io
 import unittest
 from unittest.mock import patch, MagicMock
 
-from mp4_transcriber.audio import extract_audio, check_ffmpeg_installed
+import numpy as np
+
+from mp4_transcriber.audio import extract_audio, extract_audio_to_array, check_ffmpeg_installed
 
 
 class TestAudio(unittest.TestCase):
     """Test cases for audio module functions."""
     
-    @patch('subprocess.run')
-    def test_extract_audio_success(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_extract_audio_success(self, mock_popen):
         """Test successful audio extraction."""
         # Setup mock
-        mock_run.return_value = MagicMock(returncode=0)
+        mock_popen.return_value = MagicMock(stdout=io.BytesIO(b''))
+        mock_popen.return_value.wait.return_value = 0
         
         # Call function with temporary file
         with tempfile.NamedTemporaryFile(suffix='.mp4') as video_file:
@@ -26,13 +32,46 @@ class TestAudio(unittest.TestCase):
                 
                 # Verify result
                 self.assertEqual(result, audio_file.name)
-                mock_run.assert_called_once()
+                mock_popen.assert_called_once()
     
-    @patch('subprocess.run')
-    def test_extract_audio_failure(self, mock_run):
+    @patch('subprocess.Popen')
+    def test_extract_audio_seeks_before_input(self, mock_popen):
+        """Test that a subrange seeks before opening the input."""
+        # Setup mock
+        mock_popen.return_value = MagicMock(stdout=io.BytesIO(b''))
+        mock_popen.return_value.wait.return_value = 0
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav') as audio_file:
+            extract_audio('video.mp4', audio_file.name, start=60, duration=30)
+            
+            # Verify -ss comes before -i and -t after it
+            cmd = mock_popen.call_args[0][0]
+            self.assertLess(cmd.index('-ss'), cmd.index('-i'))
+            self.assertGreater(cmd.index('-t'), cmd.index('-i'))
+    
+    @patch('subprocess.Popen')
+    def test_extract_audio_progress(self, mock_popen):
+        """Test that ffmpeg progress output is reported as a percentage."""
+        # Setup mock to report 5 of 10 seconds written, then the end
+        progress = b'out_time_ms=N/A\nout_time_ms=5000000\nprogress=end\n'
+        mock_popen.return_value = MagicMock(stdout=io.BytesIO(progress))
+        mock_popen.return_value.wait.return_value = 0
+        callback = MagicMock()
+        
+        with tempfile.NamedTemporaryFile(suffix='.wav') as audio_file:
+            extract_audio('video.mp4', audio_file.name,
+                          progress_callback=callback, total_duration=10)
+        
+        # Verify result
+        callback.assert_called_once_with(50.0)
+    
+    @patch('mp4_transcriber.audio.probe_audio', return_value=None)
+    @patch('subprocess.Popen')
+    def test_extract_audio_failure(self, mock_popen, mock_probe):
         """Test failed audio extraction."""
-        # Setup mock to raise exception
-        mock_run.side_effect = Exception("FFmpeg error")
+        # Setup mock so ffmpeg exits with an error
+        mock_popen.return_value = MagicMock(stdout=io.BytesIO(b''))
+        mock_popen.return_value.wait.return_value = 1
         
         # Call function
         with tempfile.NamedTemporaryFile(suffix='.mp4') as video_file:
@@ -41,6 +80,59 @@ class TestAudio(unittest.TestCase):
             # Verify result
             self.assertIsNone(result)
     
+    @patch('mp4_transcriber.audio.probe_audio', return_value=(16000, 1, 'mp3'))
+    @patch('subprocess.Popen')
+    def test_extract_audio_passthrough(self, mock_popen, mock_probe):
+        """Test that an MP3 file is used directly instead of being copied."""
+        result = extract_audio('podcast.mp3')
+        
+        # Verify result
+        self.assertEqual(result, 'podcast.mp3')
+        mock_popen.assert_not_called()
+    
+    @patch('subprocess.Popen')
+    def test_extract_audio_to_array(self, mock_popen):
+        """Test decoding PCM from the ffmpeg pipe into a float array."""
+        # Setup mock to stream three 16-bit samples
+        pcm = np.array([0, 16384, -32768], dtype=np.int16).tobytes()
+        process = MagicMock(stdout=io.BytesIO(pcm))
+        process.wait.return_value = 0
+        mock_popen.return_value = process
+        
+        # Call function
+        result = extract_audio_to_array('video.mp4')
+        
+        # Verify result
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, [0.0, 0.5, -1.0])
+    
+    def test_extract_audio_to_array_noisy_stderr(self):
+        """Test that a lot of stderr output does not stall decoding."""
+        # Stand-in for ffmpeg that logs far more than a pipe buffer holds
+        script = (
+            "import sys; sys.stderr.write('x' * 200000); sys.stderr.flush(); "
+            "sys.stdout.buffer.write(b'\\x00\\x40' * 4)"
+        )
+        with patch('mp4_transcriber.audio._ffmpeg_input_args', return_value=[sys.executable, '-c', script]):
+            result = extract_audio_to_array('video.mp4')
+        
+        np.testing.assert_allclose(result, [0.5] * 4)
+    
+    def test_extract_audio_to_array_cancel(self):
+        """Test that setting the cancel event stops a running decode."""
+        # Stand-in for ffmpeg that never finishes
+        script = "import sys\nwhile True: sys.stdout.buffer.write(bytes(1 << 20))"
+        cancel_event = threading.Event()
+        with patch('mp4_transcriber.audio._ffmpeg_input_args', return_value=[sys.executable, '-c', script]):
+            result = extract_audio_to_array(
+                'video.mp4',
+                progress_callback=lambda percent: cancel_event.set(),
+                total_duration=3600,
+                cancel_event=cancel_event
+            )
+        
+        self.assertIsNone(result)
+    
     @patch('subprocess.run')
     def test_check_ffmpeg_installed_true(self, mock_run):
         """Test ffmpeg installation check when installed."""
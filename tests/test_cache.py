@@ -0,0 +1,67 @@
+"""
+Tests for the cache module.
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mp4_transcriber import cache
+
+
+class TestCache(unittest.TestCase):
+    """Test cases for the transcription result cache."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        patcher = patch.object(cache, 'TRANSCRIPT_CACHE_DIR', Path(self.tmp_dir.name) / 'transcripts')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        
+        self.media_path = os.path.join(self.tmp_dir.name, 'video.mp4')
+        with open(self.media_path, 'wb') as f:
+            f.write(b'\x00' * 1024)
+    
+    def test_cache_key_depends_on_settings(self):
+        """Test that different models produce different keys."""
+        base_key = cache.cache_key(self.media_path, 'base', 'whisper')
+        
+        self.assertEqual(base_key, cache.cache_key(self.media_path, 'base', 'whisper'))
+        self.assertNotEqual(base_key, cache.cache_key(self.media_path, 'tiny', 'whisper'))
+    
+    def test_cache_key_empty_file(self):
+        """Test that an empty file, which cannot be memory-mapped, still has a key."""
+        empty_path = os.path.join(self.tmp_dir.name, 'empty.mp4')
+        open(empty_path, 'wb').close()
+        
+        self.assertNotEqual(
+            cache.cache_key(empty_path, 'base', 'whisper'),
+            cache.cache_key(self.media_path, 'base', 'whisper')
+        )
+    
+    def test_store_and_load_result(self):
+        """Test that a stored result can be loaded back."""
+        result = {
+            'text': ' Hello world.',
+            'segments': [{'id': 0, 'start': 0.0, 'end': 1.5, 'text': ' Hello world.', 'tokens': [1, 2]}],
+        }
+        
+        cache.store_result('abc', result)
+        loaded = cache.load_result('abc')
+        
+        # Only the fields needed for transcripts are kept
+        self.assertEqual(loaded, {
+            'text': ' Hello world.',
+            'segments': [{'start': 0.0, 'end': 1.5, 'text': ' Hello world.'}],
+        })
+    
+    def test_load_result_miss(self):
+        """Test that a missing entry returns None."""
+        self.assertIsNone(cache.load_result('missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
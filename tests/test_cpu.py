@@ -0,0 +1,32 @@
+"""
+Tests for the cpu module.
+"""
+
+import unittest
+from unittest.mock import mock_open, patch
+
+from mp4_transcriber import cpu
+
+
+class TestCpu(unittest.TestCase):
+    """Test cases for CPU feature detection."""
+    
+    def setUp(self):
+        cpu.cpu_flags.cache_clear()
+        self.addCleanup(cpu.cpu_flags.cache_clear)
+    
+    def test_has_cpu_flag_arm_features(self):
+        """Test that ARM 'Features' lines are read and matched by whole name."""
+        cpuinfo = "processor\t: 0\nFeatures\t: fp asimd sha1 sha2 crc32\n"
+        with patch('builtins.open', mock_open(read_data=cpuinfo)):
+            self.assertTrue(cpu.has_cpu_flag('sha_ni', 'sha2'))
+            self.assertFalse(cpu.has_cpu_flag('sha'))
+    
+    def test_cpu_flags_unreadable(self):
+        """Test that a missing /proc/cpuinfo yields no flags."""
+        with patch('builtins.open', side_effect=OSError):
+            self.assertEqual(cpu.cpu_flags(), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
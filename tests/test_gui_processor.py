@@ -0,0 +1,110 @@
+"""
+Tests for the GUI's transcription server.
+"""
+
+import os
+import queue
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from mp4_transcriber.gui import processor
+
+
+class TestTranscriptionServer(unittest.TestCase):
+    """Test cases for the model server thread."""
+    
+    def test_restart_waits_for_previous_server(self):
+        """Test that a new server only loads the model once the stopped one has exited."""
+        release = threading.Event()
+        loads = []
+        
+        def slow_transcription(model, *args):
+            release.wait(5)
+        
+        def load(model_size, *args):
+            loads.append(model_size)
+            return object()
+        
+        with patch.object(processor, '_load_server_model', side_effect=load), \
+                patch.object(processor, 'transcription_worker', side_effect=slow_transcription):
+            server = processor.TranscriptionServer()
+            server.start('base')
+            server.submit(None, 'out.txt', False, False)
+            old_thread = server.thread
+            
+            server.stop()
+            server.start('base')
+            new_thread = server.thread
+            new_thread.join(0.2)
+            
+            # The new server is still waiting for the busy one
+            self.assertEqual(loads, ['base'])
+            
+            release.set()
+            old_thread.join(5)
+            server.stop()
+            new_thread.join(5)
+        
+        self.assertEqual(loads, ['base', 'base'])
+    
+    @unittest.skipUnless(
+        hasattr(os, 'sched_setaffinity') and len(os.sched_getaffinity(0)) > 1,
+        "needs CPU affinity and more than one CPU"
+    )
+    def test_server_started_from_pinned_thread_uses_all_cpus(self):
+        """Test that a server restarted by a pinned worker does not inherit its cores."""
+        all_cpus = os.sched_getaffinity(0)
+        server = processor.TranscriptionServer()
+        server_cpus = []
+        
+        def load(*args):
+            server_cpus.append(os.sched_getaffinity(0))
+            return None
+        
+        def pinned_worker():
+            os.sched_setaffinity(0, {min(all_cpus)})
+            server.start('base')
+            server.thread.join(5)
+        
+        with patch.object(processor, '_load_server_model', side_effect=load):
+            worker = threading.Thread(target=pinned_worker)
+            worker.start()
+            worker.join(5)
+        
+        self.assertEqual(server_cpus, [all_cpus])
+
+    
+    def test_load_failure_is_logged(self):
+        """Test that a background load failure reaches the log without a job waiting."""
+        logs = []
+        server = processor.TranscriptionServer(on_log=logs.append)
+        
+        with patch.object(processor, 'load_model', side_effect=RuntimeError("out of memory")):
+            server.start('large')
+            server.thread.join(5)
+        
+        self.assertEqual(len(logs), 1)
+        self.assertIn("out of memory", logs[0])
+
+
+class TestGUIProcessor(unittest.TestCase):
+    """Test cases for the worker-side processor."""
+    
+    def test_dead_server_reports_error(self):
+        """Test that a job whose server thread died still ends with an error."""
+        signals = MagicMock()
+        gui_processor = processor.GUIProcessor(signals, processor.TranscriptionServer(), MagicMock())
+        dead_thread = threading.Thread(target=lambda: None)
+        dead_thread.start()
+        dead_thread.join()
+        
+        gui_processor.monitor_process('talk.mp4', dead_thread, queue.SimpleQueue())
+        
+        signals.error.emit.assert_called_once()
+        self.assertEqual(signals.error.emit.call_args[0][0], 'talk.mp4')
+        signals.completed.emit.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the processor module.
+"""
+
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from mp4_transcriber import processor
+from mp4_transcriber.processor import iter_media_files
+
+
+class TestProcessor(unittest.TestCase):
+    """Test cases for the video processing pipeline."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+    
+    def test_iter_media_files_ignores_case(self):
+        """Test that extensions match regardless of case and skips directories."""
+        for name in ('a.mp4', 'b.MP4', 'c.Mp4', 'd.mp3', 'e.M4A', 'notes.txt'):
+            open(os.path.join(self.tmp_dir.name, name), 'wb').close()
+        os.mkdir(os.path.join(self.tmp_dir.name, 'folder.mp4'))
+        
+        names = sorted(path.name for path in iter_media_files(self.tmp_dir.name))
+        
+        self.assertEqual(names, ['a.mp4', 'b.MP4', 'c.Mp4', 'd.mp3', 'e.M4A'])
+
+    
+    def test_batch_jobs_do_not_share_transcripts(self):
+        """Test that files with the same stem are written to different transcripts."""
+        files = [Path('talk.mp4'), Path('talk.mp3'), Path('Talk.M4A'), Path('intro.mp3')]
+        
+        outputs = [str(output) for _, output in processor._batch_jobs(files, Path('out'))]
+        
+        self.assertEqual(outputs, [
+            os.path.join('out', 'talk_transcript.txt'),
+            os.path.join('out', 'talk_mp3_transcript.txt'),
+            os.path.join('out', 'Talk_m4a_transcript.txt'),
+            os.path.join('out', 'intro_transcript.txt'),
+        ])
+    
+    def test_batch_uses_prefetched_audio(self):
+        """Test that each file is transcribed from the audio extracted ahead of it."""
+        jobs = [('a.mp4', 'a.txt'), ('b.mp4', 'b.txt'), ('c.mp4', 'c.txt')]
+        
+        with patch.object(processor, 'extract_audio', side_effect=['a.wav', None, 'c.wav']), \
+                patch.object(processor, 'process_video') as mock_process:
+            count = processor._transcribe_prefetched(iter(jobs), {'verbose': False})
+        
+        self.assertEqual(count, 3)
+        # The file whose extraction failed is skipped
+        self.assertEqual(
+            [(c.args[0], c.kwargs['audio_path']) for c in mock_process.call_args_list],
+            [('a.mp4', 'a.wav'), ('c.mp4', 'c.wav')]
+        )
+    
+    def test_batch_failure_deletes_prefetched_audio(self):
+        """Test that the audio extracted ahead is removed when a transcription fails."""
+        prefetched = os.path.join(self.tmp_dir.name, 'b.wav')
+        extracted = threading.Event()
+        jobs = [('a.mp4', 'a.txt'), ('b.mp4', 'b.txt')]
+        
+        def extract(video_path, verbose=False):
+            if video_path == 'a.mp4':
+                return 'a.wav'
+            open(prefetched, 'wb').close()
+            extracted.set()
+            return prefetched
+        
+        def fail(*args, **kwargs):
+            # Fail only once the next file's audio exists
+            extracted.wait(5)
+            raise RuntimeError("boom")
+        
+        with patch.object(processor, 'extract_audio', side_effect=extract), \
+                patch.object(processor, 'process_video', side_effect=fail):
+            with self.assertRaises(RuntimeError):
+                processor._transcribe_prefetched(iter(jobs), {'verbose': False})
+        
+        self.assertFalse(os.path.exists(prefetched))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,6 +67,42 @@ class TestTextProcessing(unittest.TestCase):
         # Verify result
         self.assertEqual(result, expected)
 
+    
+    def test_clean_transcript_abbreviations(self):
+        """Test that abbreviations do not start a new sentence."""
+        # Input with an abbreviation followed by a lowercase word
+        text = "we met dr. smith today. he was late."
+        
+        # Expected result
+        expected = "We met dr. smith today. He was late."
+        
+        # Clean the text
+        result = clean_transcript(text)
+        
+        # Verify result
+        self.assertEqual(result, expected)
+
+    
+    def test_clean_transcript_combined_cleanup(self):
+        """Test that all cleanup rules apply together in one pass."""
+        # Input mixing a marker, a split word and runs of whitespace
+        text = "a  (Unintelligible) multi-\n  word   here."
+        
+        # Expected result
+        expected = "A multiword here."
+        
+        # Clean the text
+        result = clean_transcript(text)
+        
+        # Verify result
+        self.assertEqual(result, expected)
+
+    
+    def test_clean_transcript_empty(self):
+        """Test that empty or missing text yields an empty transcript."""
+        self.assertEqual(clean_transcript(""), "")
+        self.assertEqual(clean_transcript({}), "")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests for the transcription module.
+"""
+
+import threading
+import unittest
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from mp4_transcriber import transcription
+
+try:
+    import torch
+except ImportError:
+    torch = None
+
+
+class FakeModel:
+    """Stand-in model that splits whatever it hears into 5-second segments."""
+    
+    device = SimpleNamespace(type='cpu')
+    
+    def transcribe(self, audio, **kwargs):
+        length = len(audio) / transcription.SAMPLE_RATE
+        segments = []
+        start = 0.0
+        while start < length:
+            end = min(start + 5.0, length)
+            segments.append({'start': start, 'end': end, 'text': f" {start:.0f}"})
+            start = end
+        return {'text': '', 'segments': segments, 'language': 'en'}
+
+
+class TestTranscription(unittest.TestCase):
+    """Test cases for transcription helpers."""
+    
+    def setUp(self):
+        patcher = patch.object(transcription, '_MODEL_CACHE', OrderedDict())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_format_timestamp(self):
+        """Test that timestamps are zero-padded and drop fractions of a second."""
+        self.assertEqual(transcription.format_timestamp(0), "00:00:00")
+        self.assertEqual(transcription.format_timestamp(3725.9), "01:02:05")
+    
+    def test_load_model_reuses_recent_models(self):
+        """Test that load_model caches the two most recently used models."""
+        with patch.object(transcription, '_load_model', side_effect=lambda *args: object()) as mock_load:
+            base = transcription.load_model('base', backend='whisper')
+            self.assertIs(transcription.load_model('base', backend='whisper'), base)
+            
+            transcription.load_model('small', backend='whisper')
+            transcription.load_model('large', backend='whisper')
+            
+            # 'base' was evicted, so it is loaded again
+            self.assertIsNot(transcription.load_model('base', backend='whisper'), base)
+        
+        self.assertEqual(mock_load.call_count, 4)
+
+    
+    def test_warmup_skips_cpu_models(self):
+        """Test that only models on a GPU are warmed up."""
+        with patch.object(FakeModel, 'transcribe') as mock_transcribe:
+            transcription.warmup_model(FakeModel())
+            mock_transcribe.assert_not_called()
+            
+            gpu_model = FakeModel()
+            gpu_model.device = SimpleNamespace(type='cuda')
+            transcription.warmup_model(gpu_model)
+            mock_transcribe.assert_called_once()
+    
+    def test_transcribe_parallel_covers_boundaries(self):
+        """Test that stitched chunk segments cover the whole audio without gaps or overlaps."""
+        audio = np.zeros(40 * transcription.SAMPLE_RATE, dtype=np.float32)
+        
+        for processors in (2, 3, 4):
+            segments = transcription.transcribe_parallel(audio, FakeModel(), processors)['segments']
+            
+            self.assertEqual(segments[0]['start'], 0.0)
+            self.assertAlmostEqual(segments[-1]['end'], 40.0)
+            for previous, segment in zip(segments, segments[1:]):
+                # Timestamps never go backwards and nothing is heard twice
+                self.assertAlmostEqual(segment['start'], previous['end'])
+                self.assertGreater(segment['end'], segment['start'])
+
+    
+    def test_whisper_cancel_between_windows(self):
+        """Test that an OpenAI Whisper transcription stops at the next window once cancelled."""
+        cancel_event = threading.Event()
+        decoded = []
+        
+        class WindowedModel(FakeModel):
+            def decode(self, window):
+                decoded.append(window)
+                cancel_event.set()
+            
+            def transcribe(self, audio, **kwargs):
+                for window in range(3):
+                    self.decode(window)
+        
+        model = WindowedModel()
+        with self.assertRaises(transcription.TranscriptionCancelled):
+            transcription._run_model(model, None, cancel_event=cancel_event)
+        
+        self.assertEqual(decoded, [0])
+        # The wrapper is removed again afterwards
+        self.assertNotIn('decode', vars(model))
+    
+    @unittest.skipIf(torch is None, "torch is not installed")
+    def test_bf16_decodes_float32_features(self):
+        """Test that the bf16 path hands float32 encoder output to the decoder."""
+        features = []
+        
+        class BF16Model(FakeModel):
+            device = torch.device('cpu')
+            
+            def __init__(self):
+                self.encoder = torch.nn.Linear(4, 4)
+            
+            def transcribe(self, audio, **kwargs):
+                # Whisper's decoding rejects anything but float32 with fp16=False
+                output = self.encoder(torch.ones(1, 4))
+                features.append(output.dtype)
+                return {'text': '', 'segments': [], 'language': 'en'}
+        
+        model = BF16Model()
+        with patch.object(transcription, 'has_cpu_flag', return_value=True):
+            transcription._run_model(model, None, precision='bf16')
+        
+        self.assertEqual(features, [torch.float32])
+        # The wrapper is removed again afterwards
+        self.assertNotIn('forward', vars(model.encoder))
+
+
+if __name__ == '__main__':
+    unittest.main()